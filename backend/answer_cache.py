@@ -0,0 +1,101 @@
+import os
+import re
+import sys
+import threading
+import unicodedata
+from typing import Any, Dict, Optional, Tuple
+from dotenv import load_dotenv
+
+from cache import TTLCache, cache_max_bytes
+
+# Load environment variables
+load_dotenv()
+
+_PUNCTUATION = re.compile(r"[^\w\s]", re.UNICODE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_question(question: str) -> str:
+    """
+    Normalize a user question for exact-match lookups
+    Case, Unicode width/compatibility forms, punctuation and whitespace are ignored
+    """
+    text = unicodedata.normalize("NFKC", question).casefold()
+    text = _PUNCTUATION.sub(" ", text)
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+class AnswerCache:
+    """
+    Exact-match cache of LLM answers keyed by
+    (product id, product version, normalized question, language)
+
+    The product version is the content hash from the product cache, so editing a
+    product or its FAQs naturally stops old answers from being served.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 3600.0,
+                 max_bytes: Optional[int] = None):
+        self._cache = TTLCache(
+            max_entries=max_entries,
+            ttl_seconds=ttl_seconds,
+            max_bytes=max_bytes,
+            # The answer string plus its key (tuple, normalized question, version) and LRU slot
+            sizeof=lambda answer: sys.getsizeof(answer) + 512
+        )
+        self._lock = threading.Lock()
+        self._llm_latency_total_ms = 0.0
+        self._llm_calls = 0
+        self._latency_saved_ms = 0.0
+
+    @staticmethod
+    def key(product_id: int, version: str, question: str, language: str) -> Tuple[int, str, str, str]:
+        return (product_id, version, normalize_question(question), language)
+
+    def get(self, product_id: int, version: str, question: str, language: str) -> Optional[str]:
+        """
+        Return the cached answer, or None on a miss
+        """
+        answer = self._cache.get(self.key(product_id, version, question, language))
+        if answer is not None:
+            with self._lock:
+                # Credit the average LLM latency we just avoided
+                if self._llm_calls:
+                    self._latency_saved_ms += self._llm_latency_total_ms / self._llm_calls
+        return answer
+
+    def set(self, product_id: int, version: str, question: str, language: str,
+            answer: str, llm_latency_ms: Optional[float] = None) -> None:
+        """
+        Store an answer along with how long the LLM took to produce it
+        Answers that did not come from an LLM call (e.g. semantic cache hits promoted to
+        exact matches) leave llm_latency_ms as None and do not count towards the LLM stats
+        """
+        self._cache.set(self.key(product_id, version, question, language), answer)
+        if llm_latency_ms is None:
+            return
+        with self._lock:
+            self._llm_calls += 1
+            self._llm_latency_total_ms += llm_latency_ms
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit ratio plus the LLM calls and latency the cache has saved"""
+        stats = self._cache.stats()
+        with self._lock:
+            avg_latency = self._llm_latency_total_ms / self._llm_calls if self._llm_calls else 0.0
+            stats.update({
+                "llm_calls_saved": stats["hits"],
+                "avg_llm_latency_ms": round(avg_latency, 1),
+                "latency_saved_ms": round(self._latency_saved_ms, 1),
+            })
+        return stats
+
+
+answer_cache = AnswerCache(
+    max_entries=int(os.getenv("ANSWER_CACHE_MAX_ENTRIES", "10000")),
+    ttl_seconds=float(os.getenv("ANSWER_CACHE_TTL_SECONDS", "3600")),
+    max_bytes=cache_max_bytes("answer")
+)
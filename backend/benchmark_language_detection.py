@@ -0,0 +1,69 @@
+"""
+Micro-benchmark: raw langdetect vs LanguageDetector (fast path + memo)
+
+Usage:
+    python benchmark_language_detection.py [--rounds 20]
+"""
+import argparse
+import time
+
+from langdetect import detect, DetectorFactory
+
+from language_detection import LanguageDetector
+
+SAMPLES = [
+    "What's the battery life?",
+    "Does it support external monitors?",
+    "How much does it cost?",
+    "warranty?",
+    "¿Cuánto dura la batería?",
+    "Quel est le prix ?",
+    "Wie lange hält der Akku?",
+    "Quanto costa questo prodotto?",
+    "电池续航多久？",
+    "バッテリーの寿命はどのくらいですか？",
+    "배터리 수명은 얼마나 되나요?",
+    "बैटरी कितनी देर चलती है?",
+    "Сколько стоит этот ноутбук?",
+    "แบตเตอรี่ใช้งานได้นานแค่ไหน",
+    "Berapa lama daya tahan baterai?",
+]
+
+
+def time_per_call(fn, rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for text in SAMPLES:
+            fn(text)
+    return (time.perf_counter() - started) / (rounds * len(SAMPLES)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    DetectorFactory.seed = 0
+    detect("warm up langdetect profiles")
+
+    baseline = time_per_call(detect, args.rounds)
+
+    cold = LanguageDetector()
+    first_pass = time_per_call(cold.detect, 1)
+    warm = time_per_call(cold.detect, args.rounds)
+
+    print(f"{'langdetect.detect':<34}{baseline:>10.1f} us/call")
+    print(f"{'LanguageDetector (first pass)':<34}{first_pass:>10.1f} us/call")
+    print(f"{'LanguageDetector (memo warm)':<34}{warm:>10.1f} us/call")
+    print(f"speedup (warm): {baseline / warm:.0f}x")
+    print(f"detector stats: {cold.stats()}")
+
+    print("\nagreement with langdetect:")
+    for text in SAMPLES:
+        ours, theirs = cold.detect(text), detect(text)
+        marker = "" if ours == theirs else "  <- differs"
+        print(f"  {ours:<6}{theirs:<6}{text}{marker}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Compare LLM providers on the same prompt set: latency percentiles, errors and tokens
+
+Every provider gets the same prompts (product context + question, routed to a model
+tier like /chat does) and is called directly, without retries or failover.
+
+Usage:
+    python benchmark_llm_providers.py                          # providers in LLM_PROVIDERS
+    python benchmark_llm_providers.py --providers groq,openai --rounds 5 --concurrency 4
+    python benchmark_llm_providers.py --db --tier standard     # products in DATABASE_URL, one tier
+"""
+import argparse
+import asyncio
+import os
+import time
+from typing import List, Optional, Tuple
+
+import httpx
+
+from benchmark_prompt_tokens import QUESTIONS, synthetic_product, load_db_products
+from latency import LatencyWindow
+from llm_providers import LLMProvider, load_providers
+from llm_service import LLMService
+from model_router import ModelTier, load_router
+from product_cache import build_cached_product
+
+
+def build_prompts(db: bool, tier_name: Optional[str]) -> List[Tuple[str, ModelTier]]:
+    """(prompt, tier) for every product and question"""
+    llm_service = LLMService()
+    router = load_router()
+    products = load_db_products() if db else [synthetic_product(20)]
+    prompts = []
+    for product in products:
+        entry = build_cached_product(product)
+        for question in QUESTIONS:
+            prompt, _ = llm_service.create_context_prompt(entry.context, question, response_language="en",
+                                                          faqs=entry.relevant_faqs(question))
+            if tier_name:
+                tier = router.tiers[tier_name]
+            else:
+                tier = router.route(question, entry.faq_index.best_match(question)[0])
+            prompts.append((prompt, tier))
+    return prompts
+
+
+async def run_provider(provider: LLMProvider, prompts: List[Tuple[str, ModelTier]], rounds: int,
+                       concurrency: int, timeout: httpx.Timeout) -> None:
+    latency = LatencyWindow(len(prompts) * rounds)
+    errors = 0
+    first_error = None
+    completion_tokens = 0
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def call(prompt: str, tier: ModelTier) -> None:
+        nonlocal errors, first_error, completion_tokens
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                completion = await provider.complete(prompt, tier, timeout)
+            except Exception as e:
+                errors += 1
+                first_error = first_error or f"{type(e).__name__}: {e}"
+                return
+            latency.record((time.perf_counter() - started) * 1000)
+            completion_tokens += (completion.usage or {}).get("completion_tokens") or 0
+
+    started = time.perf_counter()
+    await asyncio.gather(*(call(prompt, tier) for _ in range(rounds) for prompt, tier in prompts))
+    elapsed = time.perf_counter() - started
+
+    summary = latency.summary()
+    ok = summary["count"]
+    print(f"{provider.name:<10}{ok + errors:>7}{errors:>8}{summary['p50_ms']:>10.0f}{summary['p95_ms']:>10.0f}"
+          f"{summary['p99_ms']:>10.0f}{(completion_tokens / ok if ok else 0):>12.0f}{ok / elapsed:>10.1f}")
+    if first_error:
+        print(f"{'':<10}first error: {first_error}")
+
+
+async def benchmark(provider_names: Optional[str], prompts: List[Tuple[str, ModelTier]], rounds: int,
+                    concurrency: int) -> None:
+    timeout = httpx.Timeout(float(os.getenv("LLM_REQUEST_TIMEOUT", "30")),
+                            connect=float(os.getenv("LLM_CONNECT_TIMEOUT", "5")))
+    providers = load_providers(provider_names, timeout=timeout)
+
+    print(f"\n{len(prompts)} prompts x {rounds} rounds, concurrency {concurrency}")
+    print(f"{'provider':<10}{'calls':>7}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+          f"{'out tokens':>12}{'req/s':>10}")
+    try:
+        # One provider at a time so they do not compete for local CPU or bandwidth
+        for provider in providers:
+            await run_provider(provider, prompts, rounds, concurrency, timeout)
+    finally:
+        for provider in providers:
+            await provider.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--providers", help="comma-separated providers (default: LLM_PROVIDERS)")
+    parser.add_argument("--db", action="store_true", help="build prompts from products stored in DATABASE_URL")
+    parser.add_argument("--tier", choices=["simple", "standard", "complex"],
+                        help="use one model tier for every prompt instead of routing each question")
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    asyncio.run(benchmark(args.providers, build_prompts(args.db, args.tier), args.rounds, args.concurrency))
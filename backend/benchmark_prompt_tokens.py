@@ -0,0 +1,120 @@
+"""
+Compare prompt size with every FAQ vs only the top-k retrieved FAQs
+
+Usage:
+    python benchmark_prompt_tokens.py                 # synthetic products with 5..500 FAQs
+    python benchmark_prompt_tokens.py --db            # products in DATABASE_URL
+    python benchmark_prompt_tokens.py --top-k 3 --faqs 100 1000
+"""
+import argparse
+import random
+import time
+from typing import List
+
+from models import Product, FAQ
+from product_cache import build_cached_product, FAQ_TOP_K
+from llm_service import LLMService
+
+QUESTIONS = [
+    "What's the battery life?",
+    "Is it waterproof?",
+    "What does the warranty cover?",
+    "Can I upgrade the RAM?",
+    "Does it support external monitors?",
+    "How much does it weigh?",
+    "Which ports does it have?",
+    "Does it come with a charger?",
+]
+
+TOPICS = [
+    ("battery", "Battery life is around {n} hours depending on usage and brightness."),
+    ("warranty", "The warranty covers manufacturing defects for {n} months from purchase."),
+    ("ports", "It has {n} USB-C ports plus HDMI and an audio jack."),
+    ("weight", "The device weighs about {n}00 grams without accessories."),
+    ("waterproof", "It is rated IP{n}7 for water and dust resistance."),
+    ("memory", "Memory can be upgraded to {n}2GB through the spare RAM slot."),
+    ("display", "The display supports up to {n} external monitors over Thunderbolt."),
+    ("charger", "A {n}5W charger is included in the box."),
+    ("shipping", "Orders ship within {n} business days."),
+    ("returns", "Returns are accepted within {n}0 days in original packaging."),
+]
+
+
+def count_tokens(text: str) -> int:
+    """Token count with tiktoken when installed, otherwise the ~4 chars/token heuristic"""
+    try:
+        import tiktoken
+        return len(tiktoken.get_encoding("cl100k_base").encode(text))
+    except ImportError:
+        return max(1, len(text) // 4)
+
+
+def synthetic_product(faq_count: int, seed: int = 0) -> Product:
+    rng = random.Random(seed)
+    product = Product(
+        id=faq_count,
+        name=f"Benchmark Product {faq_count}",
+        short_description="Synthetic product for prompt size benchmarking",
+        detailed_specs="8-core CPU, 16GB RAM, 1TB SSD, 14\" display",
+        warranty_info="1-year limited warranty",
+        category="Laptops",
+        price="$999.00",
+        manufacturer="BenchCorp",
+        model_number=f"BC-{faq_count}",
+    )
+    for i in range(faq_count):
+        topic, answer = TOPICS[i % len(TOPICS)]
+        product.faqs.append(FAQ(
+            id=i + 1,
+            question=f"Question {i} about the {topic} (variant {rng.randint(1, 99)})?",
+            answer=answer.format(n=rng.randint(1, 9)),
+            category=topic,
+        ))
+    return product
+
+
+def load_db_products() -> List[Product]:
+    from sqlalchemy.orm import joinedload
+    from database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        return db.query(Product).options(joinedload(Product.faqs)).all()
+    finally:
+        db.close()
+
+
+def benchmark(products: List[Product], top_k: int) -> None:
+    llm_service = LLMService()
+
+    print(f"\n{'product':<28}{'faqs':>6}{'all-FAQ tokens':>16}{'top-k tokens':>14}{'saved':>8}{'retrieval us':>14}")
+    for product in products:
+        entry = build_cached_product(product)
+        full_tokens = 0
+        top_tokens = 0
+        retrieval_seconds = 0.0
+        for question in QUESTIONS:
+            prompt_all, _ = llm_service.create_context_prompt(entry.context, question, response_language="en")
+            started = time.perf_counter()
+            faqs = entry.relevant_faqs(question, top_k)
+            retrieval_seconds += time.perf_counter() - started
+            prompt_top, _ = llm_service.create_context_prompt(entry.context, question, response_language="en", faqs=faqs)
+            full_tokens += count_tokens(prompt_all)
+            top_tokens += count_tokens(prompt_top)
+
+        n = len(QUESTIONS)
+        saved = 1 - top_tokens / full_tokens if full_tokens else 0.0
+        print(f"{product.name[:27]:<28}{len(product.faqs):>6}{full_tokens / n:>16.0f}{top_tokens / n:>14.0f}"
+              f"{saved:>8.0%}{retrieval_seconds / n * 1e6:>14.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db", action="store_true", help="benchmark products stored in DATABASE_URL")
+    parser.add_argument("--faqs", type=int, nargs="+", default=[5, 20, 100, 500],
+                        help="FAQ counts for synthetic products")
+    parser.add_argument("--top-k", type=int, default=FAQ_TOP_K)
+    args = parser.parse_args()
+
+    products = load_db_products() if args.db else [synthetic_product(n) for n in args.faqs]
+    benchmark(products, args.top_k)
@@ -0,0 +1,165 @@
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# One memory budget (MB per worker) for every in-process cache, split between them by
+# CACHE_SHARES; <NAME>_CACHE_MAX_MB still overrides one cache's share. The default leaves
+# room in the 256M backend container for the ~160 MB the process uses before caching anything
+CACHE_MEMORY_MB = float(os.getenv("CACHE_MEMORY_MB", "40"))
+CACHE_SHARES = {"product": 0.4, "answer": 0.2, "semantic": 0.25, "translation": 0.15}
+
+
+def cache_max_bytes(name: str) -> int:
+    """Byte cap of one cache: PRODUCT_CACHE_MAX_MB etc. if set, else its share of CACHE_MEMORY_MB"""
+    megabytes = os.getenv(f"{name.upper()}_CACHE_MAX_MB")
+    if megabytes is None:
+        return int(CACHE_MEMORY_MB * CACHE_SHARES[name] * 1024 * 1024)
+    return int(float(megabytes) * 1024 * 1024)
+
+
+def deep_sizeof(obj: Any, seen: Optional[set] = None) -> int:
+    """
+    Memory held by obj and everything reachable through the dicts, lists, tuples and sets
+    it contains, counting objects shared between containers once
+    """
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    # NumPy arrays that own their data include it in getsizeof
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(k, seen) + deep_sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    return size
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache with a per-entry time-to-live and an optional memory bound
+
+    Entries are evicted least-recently-used first whenever either max_entries or
+    max_bytes (as measured by the sizeof callable) would be exceeded.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 300.0,
+                 max_bytes: Optional[int] = None,
+                 sizeof: Optional[Callable[[Any], int]] = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof or (lambda value: 0)
+
+        # key -> (value, expires_at, size)
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the cached value for key, or default if it is missing or expired
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return default
+
+            value, expires_at, _ = item
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """
+        Store value under key, evicting least-recently-used entries to stay within bounds
+        """
+        size = self.sizeof(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            # Never let a single oversized value flush the whole cache
+            return
+
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+
+            self._data[key] = (value, time.monotonic() + ttl, size)
+            self._bytes += size
+            self._evict()
+
+    def resize(self, key: Hashable) -> None:
+        """
+        Re-measure a value that grew or shrank in place (keeping its expiry) and evict
+        least-recently-used entries if the cache is now over max_bytes
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return
+            value, expires_at, old_size = item
+            size = self.sizeof(value)
+            self._data[key] = (value, expires_at, size)
+            self._bytes += size - old_size
+            self._evict()
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a single entry if present"""
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+
+    def clear(self) -> None:
+        """Drop every entry"""
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current occupancy"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._data),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _evict(self) -> None:
+        while self._data and (len(self._data) > self.max_entries or (
+                self.max_bytes is not None and self._bytes > self.max_bytes)):
+            oldest = next(iter(self._data))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _remove(self, key: Hashable) -> None:
+        _, _, size = self._data.pop(key)
+        self._bytes -= size
@@ -0,0 +1,92 @@
+import threading
+import time
+from typing import Any, Dict, Optional
+
+
+class CircuitBreaker:
+    """
+    Fails fast on calls to a dependency (the LLM API) after repeated failures
+
+    The circuit opens after failure_threshold consecutive failures and stays open
+    for reset_timeout seconds, during which allow_request() fails fast. It is then
+    half-open: one probe call is let through, and its success closes the circuit
+    while a failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._consecutive_failures = 0
+        self._opened_at: Optional[float] = None
+        self._probe_started_at: Optional[float] = None
+        self.failures = 0
+        self.successes = 0
+        self.times_opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self._opened_at < self.reset_timeout:
+            return self.OPEN
+        return self.HALF_OPEN
+
+    def allow_request(self) -> bool:
+        """False while open, and while half-open with a probe already in flight"""
+        with self._lock:
+            state = self._state()
+            if state == self.CLOSED:
+                return True
+            now = time.monotonic()
+            # A probe that never reported back (e.g. cancelled) expires after reset_timeout
+            if state == self.HALF_OPEN and (self._probe_started_at is None
+                                            or now - self._probe_started_at >= self.reset_timeout):
+                self._probe_started_at = now
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.successes += 1
+            self._consecutive_failures = 0
+            self._opened_at = None
+            self._probe_started_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            self._consecutive_failures += 1
+            state = self._state()
+            if state == self.HALF_OPEN or (state == self.CLOSED
+                                           and self._consecutive_failures >= self.failure_threshold):
+                self._opened_at = time.monotonic()
+                self._probe_started_at = None
+                self.times_opened += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            state = self._state()
+            retry_in = None
+            if state == self.OPEN:
+                retry_in = round(self.reset_timeout - (time.monotonic() - self._opened_at), 1)
+            return {
+                "state": state,
+                "consecutive_failures": self._consecutive_failures,
+                "failure_threshold": self.failure_threshold,
+                "retry_in_seconds": retry_in,
+                "failures": self.failures,
+                "successes": self.successes,
+                "times_opened": self.times_opened,
+                "rejected": self.rejected,
+            }
@@ -0,0 +1,95 @@
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+from dotenv import load_dotenv
+
+from latency import LatencyWindow
+
+# Load environment variables
+load_dotenv()
+
+
+class PoolSaturatedError(Exception):
+    """Raised when a bounded pool already has its maximum number of queued jobs"""
+
+
+class BoundedExecutor:
+    """
+    Thread pool for blocking or CPU-heavy steps (language detection, etc.) with a
+    bounded queue, so async handlers never run them on the event loop and a burst
+    cannot queue unbounded work
+
+    run() raises PoolSaturatedError immediately when max_workers + max_queue jobs
+    are already in flight; callers are expected to fall back to a cheaper answer.
+    """
+
+    def __init__(self, max_workers: int = 2, max_queue: int = 32, name: str = "cpu"):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._running = 0
+        self.completed = 0
+        self.rejected = 0
+        self.queue_wait = LatencyWindow()
+
+    @property
+    def queue_depth(self) -> int:
+        """Jobs submitted but not yet picked up by a worker"""
+        with self._lock:
+            return self._in_flight - self._running
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        with self._lock:
+            if self._in_flight >= self.max_workers + self.max_queue:
+                self.rejected += 1
+                raise PoolSaturatedError(f"{self._in_flight} jobs in flight")
+            self._in_flight += 1
+
+        submitted = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, self._call, fn, args, submitted)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def _call(self, fn: Callable[..., Any], args: tuple, submitted: float) -> Any:
+        self.queue_wait.record((time.perf_counter() - submitted) * 1000)
+        with self._lock:
+            self._running += 1
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self._running -= 1
+                self.completed += 1
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            in_flight, running = self._in_flight, self._running
+        return {
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "in_flight": in_flight,
+            "running": running,
+            "queue_depth": in_flight - running,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "queue_wait": self.queue_wait.summary(),
+        }
+
+
+# Shared pool for CPU-bound NLP steps
+nlp_pool = BoundedExecutor(
+    max_workers=int(os.getenv("NLP_POOL_WORKERS", "2")),
+    max_queue=int(os.getenv("NLP_POOL_MAX_QUEUE", "32")),
+    name="nlp"
+)
@@ -1,6 +1,10 @@
+import time
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 from models import Base
+from migrations import run_migrations
+from metrics import DB_POOL_CHECKOUT_WAIT
 import os
 from dotenv import load_dotenv
 
@@ -13,9 +17,20 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL environment variable is required")
 
+class TimedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waits for a free connection"""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - started)
+
 # Create engine with PostgreSQL configuration
 engine = create_engine(
     DATABASE_URL,
+    poolclass=TimedQueuePool,
     pool_size=10,
     max_overflow=20,
     pool_pre_ping=True  # Enables automatic reconnection handling
@@ -23,8 +38,9 @@ engine = create_engine(
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 def create_tables():
-    """Create all tables in the database"""
+    """Create all tables in the database and apply pending schema migrations"""
     Base.metadata.create_all(bind=engine)
+    run_migrations(engine)
 
 def get_db():
     """Dependency to get database session"""
@@ -0,0 +1,106 @@
+import hashlib
+import importlib
+import os
+import re
+import unicodedata
+from typing import List, Optional
+import numpy as np
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+# Words that carry no meaning for product questions; dropping them lets
+# "what is the battery life" and "battery life?" land on the same vector
+STOP_WORDS = {
+    "a", "an", "the", "is", "are", "was", "be", "does", "do", "did", "can", "could",
+    "will", "would", "should", "what", "whats", "how", "which", "who", "when", "where",
+    "it", "its", "this", "that", "i", "me", "my", "you", "your", "of", "for", "on",
+    "in", "to", "with", "and", "or", "please", "tell", "about", "there", "s",
+}
+
+
+class Embedder:
+    """
+    Interface for text embedders used by the semantic cache and FAQ matching
+    Implementations return L2-normalized float32 vectors of a fixed dimension
+    """
+
+    dimension: int
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """Return an array of shape (len(texts), dimension)"""
+        raise NotImplementedError
+
+    def embed_one(self, text: str) -> np.ndarray:
+        return self.embed([text])[0]
+
+
+class HashingEmbedder(Embedder):
+    """
+    CPU-only local embedder based on feature hashing of words and character n-grams
+
+    Needs no model download or network access. It captures lexical overlap and
+    spelling variants (battery / batteries), not deep paraphrase, so pair it with
+    a conservative similarity threshold.
+    """
+
+    def __init__(self, dimension: int = 256, ngram: int = 3):
+        self.dimension = dimension
+        self.ngram = ngram
+
+    def _features(self, text: str) -> List[str]:
+        text = unicodedata.normalize("NFKC", text).casefold()
+        words = [w for w in _TOKEN.findall(text) if w not in STOP_WORDS]
+        features = [f"w:{w}" for w in words]
+        for word in words:
+            padded = f"<{word}>"
+            features.extend(
+                f"c:{padded[i:i + self.ngram]}"
+                for i in range(max(1, len(padded) - self.ngram + 1))
+            )
+        return features
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature in self._features(text):
+                digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+                value = int.from_bytes(digest, "little")
+                # Whole words weigh more than sub-word n-grams
+                weight = 2.0 if feature.startswith("w:") else 1.0
+                sign = 1.0 if value & 1 else -1.0
+                vectors[row, (value >> 1) % self.dimension] += sign * weight
+            norm = np.linalg.norm(vectors[row])
+            if norm > 0:
+                vectors[row] /= norm
+        return vectors
+
+
+def load_embedder(spec: Optional[str] = None) -> Embedder:
+    """
+    Build the embedder named by spec (or EMBEDDER; SEMANTIC_CACHE_EMBEDDER is still read
+    as a fallback from when only the semantic cache was configurable)
+    "hashing" selects the built-in local default; anything else is imported as
+    "package.module:ClassName" and instantiated without arguments
+    """
+    spec = spec or os.getenv("EMBEDDER") or os.getenv("SEMANTIC_CACHE_EMBEDDER") or "hashing"
+    if spec == "hashing":
+        return HashingEmbedder(dimension=int(os.getenv("EMBEDDER_DIMENSION", "256")))
+
+    module_name, _, class_name = spec.partition(":")
+    embedder_class = getattr(importlib.import_module(module_name), class_name)
+    return embedder_class()
+
+
+_default_embedder: Optional[Embedder] = None
+
+
+def get_embedder() -> Embedder:
+    """Process-wide embedder shared by FAQ matching and the semantic cache (built on first use)"""
+    global _default_embedder
+    if _default_embedder is None:
+        _default_embedder = load_embedder()
+    return _default_embedder
@@ -0,0 +1,48 @@
+import re
+from typing import Any, Dict, List, Optional
+
+from faq_retrieval import FAQIndex, tokenize
+
+# Shown above extracted product text when the LLM is unavailable
+FALLBACK_NOTICE = ("Our assistant is temporarily unavailable, so here is what the product "
+                   "information says about your question:")
+
+_SENTENCE = re.compile(r"(?<=[.!?。！？])\s+|\n+")
+
+# Context fields searched for relevant sentences, in order of preference
+_TEXT_FIELDS = ("short_description", "detailed_specs", "warranty_info")
+
+
+def _sentences(context: Dict[str, Any]) -> List[str]:
+    sentences = []
+    for field in _TEXT_FIELDS:
+        text = context.get(field) or ""
+        sentences.extend(s.strip() for s in _SENTENCE.split(text) if s.strip())
+    return sentences
+
+
+def extractive_answer(context: Dict[str, Any], faq_index: Optional[FAQIndex], question: str,
+                      max_sentences: int = 2) -> Dict[str, Any]:
+    """
+    Answer from stored product data without the LLM
+    Returns {"text", "language"}: the best BM25-matching FAQ answer, else the product
+    sentences sharing the most words with the question, else the short description
+    """
+    if faq_index is not None and faq_index.faqs:
+        scores = faq_index.scores(question)
+        best = max(range(len(scores)), key=scores.__getitem__)
+        if scores[best] > 0:
+            faq = faq_index.faqs[best]
+            return {"text": faq["answer"], "language": faq.get("language")}
+
+    terms = set(tokenize(question))
+    sentences = _sentences(context)
+    ranked = sorted(
+        ((len(terms & set(tokenize(sentence))), i) for i, sentence in enumerate(sentences)),
+        key=lambda item: (-item[0], item[1])
+    )
+    picked = sorted(i for overlap, i in ranked[:max_sentences] if overlap > 0)
+    if picked:
+        return {"text": " ".join(sentences[i] for i in picked), "language": None}
+
+    return {"text": context.get("short_description") or context.get("name", ""), "language": None}
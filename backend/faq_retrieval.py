@@ -0,0 +1,98 @@
+import math
+import re
+import unicodedata
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+
+from cache import deep_sizeof
+from embeddings import STOP_WORDS, Embedder
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens with stop words removed"""
+    text = unicodedata.normalize("NFKC", text or "").casefold()
+    return [t for t in _TOKEN.findall(text) if t not in STOP_WORDS]
+
+
+class FAQIndex:
+    """
+    BM25 index over a product's FAQs, built once when the product is cached
+
+    Questions are weighted above answers so that an FAQ whose question matches
+    the user's wording ranks first. When an embedder is given, FAQ questions are
+    also embedded so best_match can answer near-duplicate questions directly.
+    """
+
+    def __init__(self, faqs: List[Dict[str, Any]], k1: float = 1.2, b: float = 0.75,
+                 question_weight: int = 2, embedder: Optional[Embedder] = None):
+        self.faqs = faqs
+        self.k1 = k1
+        self.b = b
+        self.embedder = embedder
+        self._question_vectors = (
+            embedder.embed([faq.get("question", "") for faq in faqs])
+            if embedder is not None and faqs else None
+        )
+
+        self._term_freqs: List[Counter] = []
+        self._lengths: List[int] = []
+        doc_freq: Counter = Counter()
+        for faq in faqs:
+            tokens = tokenize(faq.get("question", "")) * question_weight
+            tokens += tokenize(faq.get("answer", "")) + tokenize(faq.get("category", ""))
+            counts = Counter(tokens)
+            self._term_freqs.append(counts)
+            self._lengths.append(len(tokens))
+            doc_freq.update(counts.keys())
+
+        n = len(faqs)
+        self._avg_length = (sum(self._lengths) / n) if n else 0.0
+        self._idf = {
+            term: math.log(1 + (n - df + 0.5) / (df + 0.5))
+            for term, df in doc_freq.items()
+        }
+
+    def scores(self, query: str) -> List[float]:
+        """BM25 score of every FAQ against query"""
+        terms = [t for t in set(tokenize(query)) if t in self._idf]
+        results = []
+        for counts, length in zip(self._term_freqs, self._lengths):
+            score = 0.0
+            norm = self.k1 * (1 - self.b + self.b * length / self._avg_length) if self._avg_length else self.k1
+            for term in terms:
+                tf = counts.get(term)
+                if tf:
+                    score += self._idf[term] * tf * (self.k1 + 1) / (tf + norm)
+            results.append(score)
+        return results
+
+    def top_k(self, query: str, k: int) -> List[Dict[str, Any]]:
+        """
+        Return the k most relevant FAQs for query
+        Products with at most k FAQs, or queries that match nothing (e.g. in another
+        language), keep the stored order so the prompt still carries general context
+        """
+        if len(self.faqs) <= k:
+            return self.faqs
+
+        scores = self.scores(query)
+        ranked = sorted(range(len(self.faqs)), key=lambda i: (-scores[i], i))
+        return [self.faqs[i] for i in ranked[:k]]
+
+    def best_match(self, query: str) -> Tuple[float, Optional[Dict[str, Any]]]:
+        """
+        Return (cosine similarity, faq) for the FAQ question closest to query
+        """
+        if self._question_vectors is None:
+            return 0.0, None
+
+        scores = self._question_vectors @ self.embedder.embed_one(query)
+        best = int(np.argmax(scores))
+        return float(scores[best]), self.faqs[best]
+
+    def nbytes(self) -> int:
+        """Memory held by the BM25 term statistics and the question embeddings (not the FAQs themselves)"""
+        return deep_sizeof([self._term_freqs, self._lengths, self._idf, self._question_vectors])
@@ -0,0 +1,166 @@
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Iterable, Optional
+from langdetect import DetectorFactory, detect, LangDetectException
+
+# langdetect is probabilistic; a fixed seed makes results repeatable
+DetectorFactory.seed = 0
+
+# Scripts used by exactly one supported language
+_SCRIPT_LANGUAGES = [
+    (re.compile(r"[\uac00-\ud7af\u1100-\u11ff\u3130-\u318f]"), "ko"),  # Hangul
+    (re.compile(r"[\u3040-\u30ff]"), "ja"),  # Hiragana / Katakana
+    (re.compile(r"[\u0e00-\u0e7f]"), "th"),  # Thai
+    (re.compile(r"[\u0900-\u097f]"), "hi"),  # Devanagari
+]
+
+_WORD = re.compile(r"[a-z']+")
+
+ENGLISH_MARKERS = {
+    "the", "is", "are", "what", "whats", "what's", "how", "does", "do", "can", "this",
+    "it", "which", "much", "many", "long", "have", "has", "with", "there", "my", "i",
+    "you", "your", "of", "for", "and", "will", "should", "price", "warranty", "battery",
+}
+
+# Function words of other Latin-script languages; any of these sends the text to langdetect
+FOREIGN_MARKERS = {
+    "el", "la", "los", "las", "que", "es", "cuanto", "cuanta", "como", "tiene", "por",  # es
+    "le", "les", "est", "quel", "quelle", "combien", "avec", "pour", "une", "des",      # fr
+    "der", "die", "das", "ist", "wie", "viel", "hat", "und", "mit", "kann", "ein",      # de
+    "il", "di", "che", "quanto", "costa", "della", "sono",                              # it
+    "o", "os", "qual", "quanto", "tem", "uma", "voce",                                  # pt
+    "het", "een", "hoe", "wat", "heeft", "van",                                         # nl
+    "apa", "berapa", "ini", "itu", "ada", "dengan", "yang", "untuk",                    # id / ms
+    "jak", "czy", "jest", "ile",                                                        # pl
+    "bu", "ne", "kadar", "mi", "var",                                                   # tr
+}
+
+
+class LanguageDetector:
+    """
+    Language detection with a script/ASCII fast path and an LRU memo
+
+    Obvious cases (Korean, Japanese, Thai, Devanagari scripts; plain-ASCII English)
+    are resolved without langdetect. Everything else goes through langdetect once
+    per distinct text.
+    """
+
+    def __init__(self, cache_size: int = 4096, default: str = "en"):
+        self.cache_size = cache_size
+        self.default = default
+        self._memo: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.fast_path_hits = 0
+        self.memo_hits = 0
+        self.model_calls = 0
+        self.hint_hits = 0
+
+    def fast_path(self, text: str) -> Optional[str]:
+        """Return the language when it is obvious from script or vocabulary, else None"""
+        for pattern, language in _SCRIPT_LANGUAGES:
+            if pattern.search(text):
+                return language
+
+        if text.isascii():
+            words = _WORD.findall(text.lower())
+            if any(word in FOREIGN_MARKERS for word in words):
+                return None
+            if sum(1 for word in words if word in ENGLISH_MARKERS) >= 1:
+                return "en"
+
+        return None
+
+    def detect_cached(self, text: str, hint: Optional[str] = None) -> Optional[str]:
+        """
+        Resolve text without running the model (fast path, hint or memo)
+        Returns None when langdetect would have to run
+        """
+        text = unicodedata.normalize("NFC", text).strip()
+        if not text:
+            return self.default
+
+        language = self.fast_path(text)
+        if language is not None:
+            self.fast_path_hits += 1
+            return language
+
+        if hint:
+            self.hint_hits += 1
+            return hint
+
+        key = text.casefold()
+        with self._lock:
+            language = self._memo.get(key)
+            if language is not None:
+                self._memo.move_to_end(key)
+                self.memo_hits += 1
+        return language
+
+    def detect(self, text: str, hint: Optional[str] = None) -> str:
+        """
+        Detect the language of text as an ISO 639-1 code (langdetect naming)
+        hint (e.g. from Accept-Language) is used when the fast path is inconclusive,
+        skipping the probabilistic model
+        """
+        text = unicodedata.normalize("NFC", text).strip()
+        language = self.detect_cached(text, hint)
+        if language is not None:
+            return language
+
+        key = text.casefold()
+        try:
+            language = detect(text)
+        except LangDetectException:
+            language = self.default
+        self.model_calls += 1
+
+        with self._lock:
+            self._memo[key] = language
+            if len(self._memo) > self.cache_size:
+                self._memo.popitem(last=False)
+        return language
+
+    def stats(self):
+        return {
+            "fast_path_hits": self.fast_path_hits,
+            "hint_hits": self.hint_hits,
+            "memo_hits": self.memo_hits,
+            "model_calls": self.model_calls,
+            "memo_entries": len(self._memo),
+        }
+
+
+def parse_accept_language(header: Optional[str], supported: Iterable[str]) -> Optional[str]:
+    """
+    Return the highest-weighted supported language from an Accept-Language header
+    "es-ES,es;q=0.9,en;q=0.8" -> "es"; "zh-TW" -> "zh-tw"
+    """
+    if not header:
+        return None
+
+    supported = set(supported)
+    candidates = []
+    for position, part in enumerate(header.split(",")):
+        tag, _, params = part.strip().partition(";")
+        tag = tag.strip().lower()
+        if not tag or tag == "*":
+            continue
+        weight = 1.0
+        if params.strip().startswith("q="):
+            try:
+                weight = float(params.strip()[2:])
+            except ValueError:
+                continue
+        candidates.append((-weight, position, tag))
+
+    for _, _, tag in sorted(candidates):
+        if tag in supported:
+            return tag
+        base = tag.split("-")[0]
+        if base in supported:
+            return base
+        if base == "zh":
+            return "zh-cn"
+    return None
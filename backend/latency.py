@@ -0,0 +1,68 @@
+import threading
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+
+def _quantile(sorted_samples: List[float], q: float) -> float:
+    index = min(len(sorted_samples) - 1, max(0, int(round(q * (len(sorted_samples) - 1)))))
+    return sorted_samples[index]
+
+
+class LatencyWindow:
+    """
+    Rolling window of recent latencies (milliseconds) with percentile summaries
+    """
+
+    def __init__(self, size: int = 1000):
+        self._samples = deque(maxlen=size)
+        self._lock = threading.Lock()
+        self.count = 0
+
+    def record(self, latency_ms: float) -> None:
+        with self._lock:
+            self._samples.append(latency_ms)
+            self.count += 1
+
+    def percentile(self, q: float) -> float:
+        """Latency at quantile q (0..1) over the window, 0.0 when empty"""
+        with self._lock:
+            samples = sorted(self._samples)
+        return _quantile(samples, q) if samples else 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            samples = sorted(self._samples)
+            count = self.count
+        if not samples:
+            return {"count": count, "avg_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0}
+        return {
+            "count": count,
+            "avg_ms": round(sum(samples) / len(samples), 2),
+            "p50_ms": round(_quantile(samples, 0.5), 2),
+            "p95_ms": round(_quantile(samples, 0.95), 2),
+            "p99_ms": round(_quantile(samples, 0.99), 2),
+        }
+
+
+class LatencyByKey:
+    """
+    One LatencyWindow per key (e.g. answer source), created on first use
+    """
+
+    def __init__(self, window_size: int = 1000):
+        self.window_size = window_size
+        self._windows: Dict[str, LatencyWindow] = {}
+        self._lock = threading.Lock()
+
+    def record(self, key: str, latency_ms: float) -> None:
+        window = self._windows.get(key)
+        if window is None:
+            with self._lock:
+                window = self._windows.setdefault(key, LatencyWindow(self.window_size))
+        window.record(latency_ms)
+
+    def window(self, key: str) -> Optional[LatencyWindow]:
+        return self._windows.get(key)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        return {key: window.summary() for key, window in list(self._windows.items())}
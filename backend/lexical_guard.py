@@ -0,0 +1,74 @@
+import os
+import re
+import unicodedata
+from typing import Set
+from dotenv import load_dotenv
+
+from embeddings import STOP_WORDS
+
+# Load environment variables
+load_dotenv()
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+_CONTRACTION = re.compile(r"(?:\b(?:ca|wo)n|n)['’]t\b")
+# Model codes and sizes written with hyphens: USB-C, Wi-Fi-6E, 15-inch
+_CODE = re.compile(r"\w+(?:-\w+)+", re.UNICODE)
+
+# Words that flip the meaning of a question: "Is it waterproof?" vs "Is it not waterproof?"
+NEGATION_WORDS = {
+    "not", "no", "never", "none", "nothing", "without", "cannot", "nor",
+    "ne", "pas", "sans", "nicht", "kein", "keine", "ohne", "nunca", "sin", "nao", "não", "non", "senza",
+}
+
+# Content words must have a counterpart in the other question; set to false with an EMBEDDER
+# that matches real paraphrases ("battery life" / "how long does the battery last")
+CHECK_CONTENT_WORDS = os.getenv("LEXICAL_GUARD_CONTENT_WORDS", "true").lower() == "true"
+
+
+def _normalize(text: str) -> str:
+    return _CONTRACTION.sub(" not", unicodedata.normalize("NFKC", text).casefold())
+
+
+def _trigrams(word: str) -> Set[str]:
+    padded = f"<{word}>"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _variants(word: str, other: str) -> bool:
+    """Same word or a spelling variant of it (battery / batteries, color / colour)"""
+    if word == other:
+        return True
+    if len(word) < 4 or len(other) < 4 or word[:4] != other[:4]:
+        return False
+    a, b = _trigrams(word), _trigrams(other)
+    return 2 * len(a & b) / (len(a) + len(b)) >= 0.6
+
+
+def _covered(words: Set[str], others: Set[str]) -> bool:
+    return all(any(_variants(word, other) for other in others) for word in words)
+
+
+def lexically_compatible(question: str, other: str) -> bool:
+    """
+    False when two questions that embed close together still ask different things:
+    one is negated and the other is not, they mention different numbers or model codes
+    (4K / 8K, USB-A / USB-C), or a content word of either has no counterpart in the other
+
+    Embedding similarity alone cannot tell these apart with the hashing embedder, whose
+    n-gram features barely move when a single short word changes.
+    """
+    text, other_text = _normalize(question), _normalize(other)
+    tokens, other_tokens = set(_TOKEN.findall(text)), set(_TOKEN.findall(other_text))
+    if bool(tokens & NEGATION_WORDS) != bool(other_tokens & NEGATION_WORDS):
+        return False
+
+    numbers = {t for t in tokens if any(c.isdigit() for c in t)}
+    other_numbers = {t for t in other_tokens if any(c.isdigit() for c in t)}
+    if numbers != other_numbers or set(_CODE.findall(text)) != set(_CODE.findall(other_text)):
+        return False
+
+    if not CHECK_CONTENT_WORDS:
+        return True
+    content = tokens - NEGATION_WORDS - numbers - STOP_WORDS
+    other_content = other_tokens - NEGATION_WORDS - other_numbers - STOP_WORDS
+    return _covered(content, other_content) and _covered(other_content, content)
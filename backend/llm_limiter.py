@@ -0,0 +1,115 @@
+import asyncio
+import math
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+from latency import LatencyWindow
+from metrics import LLM_IN_FLIGHT, LLM_QUEUE_DEPTH, LLM_QUEUE_WAIT, LLM_REJECTED
+
+
+class LLMOverloadedError(Exception):
+    """
+    The LLM cannot take this request now: the local queue is full or the wait timed
+    out (503), or the provider rate-limited us (429)
+    retry_after is the number of seconds clients should wait before retrying
+    """
+
+    def __init__(self, message: str, status_code: int = 503, retry_after: int = 1):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class LLMLimiter:
+    """
+    Caps concurrent LLM calls per process and bounds how many requests wait, and for
+    how long, for a free slot
+
+    Requests beyond max_in_flight wait in FIFO order for up to max_wait seconds;
+    when max_queue requests are already waiting, new ones are rejected immediately.
+    Either way the caller gets LLMOverloadedError instead of a late or failed answer.
+    """
+
+    def __init__(self, max_in_flight: int = 32, max_queue: int = 64, max_wait: float = 5.0):
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+        self._in_flight = 0
+        self._waiting = 0
+        self.queue_full = 0
+        self.timed_out = 0
+        self.queue_wait = LatencyWindow()
+        # How long calls hold a slot, used to estimate Retry-After
+        self.hold_time = LatencyWindow(200)
+
+    @property
+    def queue_depth(self) -> int:
+        return self._waiting
+
+    @property
+    def free_slots(self) -> int:
+        return self.max_in_flight - self._in_flight
+
+    def retry_after(self) -> int:
+        """Seconds until a slot is likely to be free: queued work divided by concurrency"""
+        hold_seconds = (self.hold_time.percentile(0.5) or 1000.0) / 1000
+        estimate = hold_seconds * (self._waiting + 1) / self.max_in_flight
+        return max(1, min(60, math.ceil(estimate)))
+
+    def check(self) -> None:
+        """Reject up front when the queue is already full (e.g. before starting a stream)"""
+        if self._semaphore.locked() and self._waiting >= self.max_queue:
+            self.queue_full += 1
+            LLM_REJECTED.labels("queue_full").inc()
+            raise LLMOverloadedError("LLM queue is full", retry_after=self.retry_after())
+
+    async def acquire(self, max_wait: Optional[float] = None) -> None:
+        self.check()
+
+        started = time.perf_counter()
+        self._waiting += 1
+        LLM_QUEUE_DEPTH.set(self._waiting)
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), max_wait or self.max_wait)
+        except asyncio.TimeoutError:
+            self.timed_out += 1
+            LLM_REJECTED.labels("timeout").inc()
+            raise LLMOverloadedError("Timed out waiting for an LLM slot", retry_after=self.retry_after())
+        finally:
+            self._waiting -= 1
+            LLM_QUEUE_DEPTH.set(self._waiting)
+            waited = time.perf_counter() - started
+            self.queue_wait.record(waited * 1000)
+            LLM_QUEUE_WAIT.observe(waited)
+
+        self._in_flight += 1
+        LLM_IN_FLIGHT.set(self._in_flight)
+
+    def release(self, held_ms: float) -> None:
+        self._in_flight -= 1
+        LLM_IN_FLIGHT.set(self._in_flight)
+        self.hold_time.record(held_ms)
+        self._semaphore.release()
+
+    @asynccontextmanager
+    async def slot(self, max_wait: Optional[float] = None) -> AsyncIterator[None]:
+        await self.acquire(max_wait)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.release((time.perf_counter() - started) * 1000)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_in_flight": self.max_in_flight,
+            "max_queue": self.max_queue,
+            "max_wait_seconds": self.max_wait,
+            "in_flight": self._in_flight,
+            "queue_depth": self._waiting,
+            "rejected_queue_full": self.queue_full,
+            "rejected_timeout": self.timed_out,
+            "queue_wait": self.queue_wait.summary(),
+        }
@@ -0,0 +1,557 @@
+import asyncio
+import json
+import logging
+import math
+import os
+import random
+import httpx
+from dataclasses import dataclass
+from groq import AsyncGroq, APIConnectionError, APIStatusError, InternalServerError, RateLimitError
+from typing import Any, AsyncIterator, Collection, Dict, List, Optional
+from dotenv import load_dotenv
+
+from circuit_breaker import CircuitBreaker
+from latency import LatencyByKey
+from model_router import ModelTier
+from metrics import LLM_PROVIDER_LATENCY
+
+# Load environment variables
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+SYSTEM_PROMPT = "You are a helpful product support assistant. Always respond in the language requested by the user."
+
+
+class ProviderError(Exception):
+    """
+    A provider call failed
+    retryable is True for transient failures (connection errors, timeouts, 5xx)
+    """
+
+    def __init__(self, message: str, retryable: bool = True):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+class ProviderRateLimitError(Exception):
+    """
+    The provider answered 429; retry_after is its Retry-After in seconds
+    """
+
+    def __init__(self, message: str, retry_after: int = 5):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+@dataclass
+class Completion:
+    """
+    Text and token usage of one completion, whatever the provider
+    """
+    text: str
+    usage: Optional[Dict[str, Any]] = None
+
+
+def retry_after_seconds(headers: Any, default: int = 5) -> int:
+    """Retry-After header as whole seconds (at least 1)"""
+    try:
+        return max(1, math.ceil(float(headers.get("retry-after", ""))))
+    except (TypeError, ValueError):
+        return default
+
+
+def chat_messages(prompt: str) -> List[Dict[str, str]]:
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": prompt}
+    ]
+
+
+def build_http_client(timeout: httpx.Timeout, max_connections: int, max_keepalive_connections: int,
+                      **kwargs: Any) -> httpx.AsyncClient:
+    """
+    One pooled HTTP client per provider, shared by every request so concurrent chats
+    reuse keep-alive connections instead of opening a new TLS session each time
+    """
+    return httpx.AsyncClient(
+        timeout=timeout,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections
+        ),
+        **kwargs
+    )
+
+
+class LLMProvider:
+    """
+    Interface for LLM backends
+    complete and stream raise ProviderError or ProviderRateLimitError on failure;
+    retries, failover and circuit breaking are done by ProviderPool and LLMService
+    """
+
+    name = "base"
+    is_mock = False
+
+    def __init__(self, model: Optional[str] = None):
+        # Overrides the tier's model, e.g. for endpoints that do not serve Groq's model names
+        self.model = model
+
+    def model_for(self, tier: ModelTier) -> str:
+        return self.model or tier.model
+
+    async def complete(self, prompt: str, tier: ModelTier, timeout: httpx.Timeout) -> Completion:
+        raise NotImplementedError
+
+    async def stream(self, prompt: str, tier: ModelTier, timeout: httpx.Timeout) -> AsyncIterator[Dict[str, Any]]:
+        """
+        {"type": "token"} events, then {"type": "usage"} if reported
+        The default sends the whole completion as one token for providers that cannot stream
+        """
+        completion = await self.complete(prompt, tier, timeout)
+        yield {"type": "token", "text": completion.text}
+        if completion.usage is not None:
+            yield {"type": "usage", "usage": completion.usage}
+
+    async def warm_up(self, timeout: httpx.Timeout) -> bool:
+        """Open a connection before the first request needs it; False when there is nothing to warm"""
+        return False
+
+    async def close(self) -> None:
+        pass
+
+
+class GroqProvider(LLMProvider):
+    """
+    Groq chat completions via the groq SDK on a pooled HTTP client
+    """
+
+    name = "groq"
+
+    def __init__(self, api_key: str, http_client: httpx.AsyncClient, timeout: httpx.Timeout,
+                 model: Optional[str] = None):
+        super().__init__(model)
+        self.http_client = http_client
+        self.client = AsyncGroq(
+            api_key=api_key,
+            http_client=http_client,
+            timeout=timeout,
+            # Retries are done by LLMService so they share the deadline and retry budget
+            max_retries=0
+        )
+
+    @staticmethod
+    def _provider_error(error: Exception) -> Exception:
+        if isinstance(error, RateLimitError):
+            return ProviderRateLimitError("Groq rate limit reached", retry_after_seconds(error.response.headers))
+        if isinstance(error, (APIConnectionError, InternalServerError)):
+            return ProviderError(f"Groq: {error}")
+        return ProviderError(f"Groq: {error}", retryable=False)
+
+    async def complete(self, prompt: str, tier: ModelTier, timeout: httpx.Timeout) -> Completion:
+        try:
+            response = await self.client.chat.completions.create(
+                model=self.model_for(tier),
+                messages=chat_messages(prompt),
+                max_tokens=tier.max_tokens,
+                temperature=tier.temperature,
+                timeout=timeout
+            )
+        except (APIConnectionError, APIStatusError) as e:
+            raise self._provider_error(e) from e
+        usage = response.usage.model_dump() if response.usage is not None else None
+        return Completion(text=response.choices[0].message.content, usage=usage)
+
+    async def stream(self, prompt: str, tier: ModelTier, timeout: httpx.Timeout) -> AsyncIterator[Dict[str, Any]]:
+        usage = None
+        try:
+            stream = await self.client.chat.completions.create(
+                model=self.model_for(tier),
+                messages=chat_messages(prompt),
+                max_tokens=tier.max_tokens,
+                temperature=tier.temperature,
+                timeout=timeout,
+                stream=True
+            )
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield {"type": "token", "text": chunk.choices[0].delta.content}
+                # Groq reports usage on the final chunk under x_groq
+                x_groq = getattr(chunk, "x_groq", None)
+                if x_groq is not None and getattr(x_groq, "usage", None) is not None:
+                    usage = x_groq.usage.model_dump()
+        except (APIConnectionError, APIStatusError) as e:
+            raise self._provider_error(e) from e
+        if usage is not None:
+            yield {"type": "usage", "usage": usage}
+
+    async def warm_up(self, timeout: httpx.Timeout) -> bool:
+        await self.client.models.list(timeout=timeout)
+        return True
+
+    async def close(self) -> None:
+        await self.client.close()
+
+
+class OpenAICompatibleProvider(LLMProvider):
+    """
+    Any endpoint speaking the OpenAI chat completions API (OpenAI, Together, vLLM,
+    Ollama, llama.cpp server, ...) over plain httpx
+    """
+
+    name = "openai"
+
+    def __init__(self, base_url: str, http_client: httpx.AsyncClient, api_key: Optional[str] = None,
+                 model: Optional[str] = None, name: Optional[str] = None):
+        super().__init__(model)
+        self.base_url = base_url.rstrip("/")
+        self.http_client = http_client
+        self.headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+        if name:
+            self.name = name
+
+    def _payload(self, prompt: str, tier: ModelTier, stream: bool = False) -> Dict[str, Any]:
+        payload = {
+            "model": self.model_for(tier),
+            "messages": chat_messages(prompt),
+            "max_tokens": tier.max_tokens,
+            "temperature": tier.temperature,
+        }
+        if stream:
+            payload["stream"] = True
+            payload["stream_options"] = {"include_usage": True}
+        return payload
+
+    def _check(self, response: httpx.Response) -> None:
+        if response.status_code == 429:
+            raise ProviderRateLimitError(f"{self.name} rate limit reached", retry_after_seconds(response.headers))
+        if response.status_code >= 400:
+            raise ProviderError(f"{self.name}: HTTP {response.status_code}", retryable=response.status_code >= 500)
+
+    async def complete(self, prompt: str, tier: ModelTier, timeout: httpx.Timeout) -> Completion:
+        try:
+            response = await self.http_client.post(f"{self.base_url}/chat/completions", headers=self.headers,
+                                                   json=self._payload(prompt, tier), timeout=timeout)
+        except httpx.TransportError as e:
+            raise ProviderError(f"{self.name}: {type(e).__name__}") from e
+        self._check(response)
+        data = response.json()
+        return Completion(text=data["choices"][0]["message"]["content"], usage=data.get("usage"))
+
+    async def stream(self, prompt: str, tier: ModelTier, timeout: httpx.Timeout) -> AsyncIterator[Dict[str, Any]]:
+        usage = None
+        try:
+            async with self.http_client.stream("POST", f"{self.base_url}/chat/completions", headers=self.headers,
+                                               json=self._payload(prompt, tier, stream=True),
+                                               timeout=timeout) as response:
+                if response.status_code >= 400:
+                    await response.aread()
+                self._check(response)
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[5:].strip()
+                    if data == "[DONE]":
+                        break
+                    chunk = json.loads(data)
+                    if chunk.get("choices") and chunk["choices"][0].get("delta", {}).get("content"):
+                        yield {"type": "token", "text": chunk["choices"][0]["delta"]["content"]}
+                    if chunk.get("usage"):
+                        usage = chunk["usage"]
+        except httpx.TransportError as e:
+            raise ProviderError(f"{self.name}: {type(e).__name__}") from e
+        if usage is not None:
+            yield {"type": "usage", "usage": usage}
+
+    async def warm_up(self, timeout: httpx.Timeout) -> bool:
+        await self.http_client.get(f"{self.base_url}/models", headers=self.headers, timeout=timeout)
+        return True
+
+    async def close(self) -> None:
+        await self.http_client.aclose()
+
+
+class LocalHTTPProvider(LLMProvider):
+    """
+    Minimal JSON-over-HTTP stand-in (e.g. a local model server or a load-test fake)
+    POST {"model", "system", "prompt", "max_tokens", "temperature"} -> {"text", "usage"}
+    """
+
+    name = "local"
+
+    def __init__(self, url: str, http_client: httpx.AsyncClient, model: Optional[str] = None):
+        super().__init__(model)
+        self.url = url
+        self.http_client = http_client
+
+    async def complete(self, prompt: str, tier: ModelTier, timeout: httpx.Timeout) -> Completion:
+        try:
+            response = await self.http_client.post(self.url, json={
+                "model": self.model_for(tier),
+                "system": SYSTEM_PROMPT,
+                "prompt": prompt,
+                "max_tokens": tier.max_tokens,
+                "temperature": tier.temperature,
+            }, timeout=timeout)
+        except httpx.TransportError as e:
+            raise ProviderError(f"local: {type(e).__name__}") from e
+        if response.status_code == 429:
+            raise ProviderRateLimitError("local rate limit reached", retry_after_seconds(response.headers))
+        if response.status_code >= 400:
+            raise ProviderError(f"local: HTTP {response.status_code}", retryable=response.status_code >= 500)
+        data = response.json()
+        return Completion(text=data["text"], usage=data.get("usage"))
+
+    async def close(self) -> None:
+        await self.http_client.aclose()
+
+
+class MockProvider(LLMProvider):
+    """
+    Canned keyword-based answers for demos and load tests, returned after latency_ms
+    """
+
+    name = "mock"
+    is_mock = True
+
+    def __init__(self, latency_ms: float = 0.0):
+        super().__init__()
+        self.latency_ms = latency_ms
+
+    async def complete(self, prompt: str, tier: ModelTier, timeout: httpx.Timeout) -> Completion:
+        if self.latency_ms > 0:
+            await asyncio.sleep(self.latency_ms / 1000)
+        return Completion(text=mock_response(prompt))
+
+
+def load_providers(names: Optional[str] = None, timeout: Optional[httpx.Timeout] = None,
+                   max_connections: int = 200, max_keepalive_connections: int = 50) -> List[LLMProvider]:
+    """
+    Build the providers listed in names or LLM_PROVIDERS (groq, openai, local, mock),
+    in order of preference; defaults to groq when GROQ_API_KEY is set, otherwise mock
+    Providers that are not configured are skipped; with none left the mock is used
+    """
+    timeout = timeout or httpx.Timeout(30.0, connect=5.0)
+    names = names or os.getenv("LLM_PROVIDERS") or ("groq" if os.getenv("GROQ_API_KEY") else "mock")
+
+    def http_client(**kwargs: Any) -> httpx.AsyncClient:
+        return build_http_client(timeout, max_connections, max_keepalive_connections, **kwargs)
+
+    providers: List[LLMProvider] = []
+    for name in (n.strip().lower() for n in names.split(",") if n.strip()):
+        try:
+            if name == "groq":
+                api_key = os.getenv("GROQ_API_KEY")
+                if not api_key:
+                    logger.warning("No GROQ_API_KEY found, skipping the groq provider")
+                    continue
+                providers.append(GroqProvider(api_key, http_client(), timeout, model=os.getenv("GROQ_MODEL")))
+            elif name == "openai":
+                providers.append(OpenAICompatibleProvider(
+                    os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1"), http_client(),
+                    api_key=os.getenv("OPENAI_API_KEY"), model=os.getenv("OPENAI_MODEL")
+                ))
+            elif name == "local":
+                providers.append(LocalHTTPProvider(
+                    os.getenv("LOCAL_LLM_URL", "http://localhost:8081/generate"), http_client(),
+                    model=os.getenv("LOCAL_LLM_MODEL")
+                ))
+            elif name == "mock":
+                providers.append(MockProvider(latency_ms=float(os.getenv("MOCK_LLM_LATENCY_MS", "0"))))
+            else:
+                raise ValueError(f"Unknown LLM provider: {name}")
+            logger.info("LLM provider %s initialized", name)
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error("Failed to initialize LLM provider %s: %s", name, e)
+
+    if not providers:
+        logger.warning("No LLM provider available, using mock responses")
+        providers.append(MockProvider())
+    return providers
+
+
+class ProviderPool:
+    """
+    Tracks health (a circuit breaker each) and per-tier latency of every provider and
+    picks a healthy one per call
+
+    Providers are tried in configured order; traffic moves away from the preferred
+    provider only when another one is faster by more than latency_tolerance (a fraction
+    of its median latency). Providers without latency samples count as fast enough, and
+    explore_rate of calls go to a random healthy provider so the others get measured.
+    A mock provider is only kept when no real one is configured: its canned answers are
+    about a demo product, so failing over to it would return (and cache) made-up answers
+    with ok=True where the caller should have fallen back.
+    """
+
+    def __init__(self, providers: List[LLMProvider], failure_threshold: int = 5,
+                 reset_timeout: float = 30.0, explore_rate: float = 0.05, latency_tolerance: float = 0.25):
+        real = [p for p in providers if not p.is_mock]
+        if real and len(real) < len(providers):
+            logger.warning("Ignoring the mock LLM provider: it is not a failover for real providers")
+        self.providers = real or providers
+        self.explore_rate = explore_rate if len(self.providers) > 1 else 0.0
+        self.latency_tolerance = latency_tolerance
+        self.circuits = {p.name: CircuitBreaker(failure_threshold, reset_timeout) for p in self.providers}
+        self.latency = {p.name: LatencyByKey(200) for p in self.providers}
+        self.calls = {p.name: 0 for p in self.providers}
+        self.rate_limited = {p.name: 0 for p in self.providers}
+
+    @property
+    def use_mock(self) -> bool:
+        return all(p.is_mock for p in self.providers)
+
+    def available(self) -> bool:
+        """True unless every provider's circuit is open"""
+        return any(circuit.state != CircuitBreaker.OPEN for circuit in self.circuits.values())
+
+    def _expected_ms(self, provider: LLMProvider, tier_name: str) -> Optional[float]:
+        """Median latency for the tier, None before the first sample"""
+        window = self.latency[provider.name].window(tier_name)
+        return window.percentile(0.5) if window is not None else None
+
+    def _ranked(self, tier_name: str, avoid: Collection[LLMProvider]) -> List[LLMProvider]:
+        """Healthy providers, the one to call first at the head"""
+        # Not-yet-tried before tried; sorting is stable so configured order is kept
+        healthy = sorted((p for p in self.providers if self.circuits[p.name].state != CircuitBreaker.OPEN),
+                         key=lambda p: p in avoid)
+        if not healthy:
+            return []
+        group = [p for p in healthy if (p in avoid) == (healthy[0] in avoid)]
+
+        if self.explore_rate and len(group) > 1 and random.random() < self.explore_rate:
+            chosen = random.choice(group)
+        else:
+            expected = {p.name: self._expected_ms(p, tier_name) for p in group}
+            measured = [ms for ms in expected.values() if ms is not None]
+            limit = min(measured) * (1 + self.latency_tolerance) if measured else None
+            chosen = next(p for p in group
+                          if limit is None or expected[p.name] is None or expected[p.name] <= limit)
+        return [chosen] + [p for p in healthy if p is not chosen]
+
+    def select(self, tier_name: str, avoid: Collection[LLMProvider] = ()) -> Optional[LLMProvider]:
+        """
+        Healthy provider for the tier, preferring ones not in avoid (e.g. providers that
+        already failed this request); None when every circuit is open
+        """
+        for provider in self._ranked(tier_name, avoid):
+            if self.circuits[provider.name].allow_request():
+                return provider
+        return None
+
+    def record_success(self, provider: LLMProvider, tier_name: str, latency_ms: Optional[float] = None) -> None:
+        self.calls[provider.name] += 1
+        self.circuits[provider.name].record_success()
+        if latency_ms is not None:
+            self.latency[provider.name].record(tier_name, latency_ms)
+            LLM_PROVIDER_LATENCY.labels(provider.name, "ok").observe(latency_ms / 1000)
+
+    def record_failure(self, provider: LLMProvider, latency_ms: float) -> None:
+        self.calls[provider.name] += 1
+        self.circuits[provider.name].record_failure()
+        LLM_PROVIDER_LATENCY.labels(provider.name, "error").observe(latency_ms / 1000)
+
+    def record_rate_limited(self, provider: LLMProvider) -> None:
+        # A 429 means the provider is healthy but busy, so the circuit is left alone
+        self.calls[provider.name] += 1
+        self.rate_limited[provider.name] += 1
+
+    def circuit_stats(self) -> Dict[str, Any]:
+        """Combined circuit state for readiness: open only when every provider is open"""
+        states = {name: circuit.stats() for name, circuit in self.circuits.items()}
+        if any(s["state"] == CircuitBreaker.CLOSED for s in states.values()):
+            state = CircuitBreaker.CLOSED
+        elif any(s["state"] == CircuitBreaker.HALF_OPEN for s in states.values()):
+            state = CircuitBreaker.HALF_OPEN
+        else:
+            state = CircuitBreaker.OPEN
+        return {"state": state, "providers": states}
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            p.name: {
+                "state": self.circuits[p.name].state,
+                "calls": self.calls[p.name],
+                "rate_limited": self.rate_limited[p.name],
+                "latency": self.latency[p.name].summary(),
+            }
+            for p in self.providers
+        }
+
+    async def warm_up(self, timeout: httpx.Timeout) -> bool:
+        """Warm every provider concurrently; True when at least one opened a connection"""
+        results = await asyncio.gather(*(p.warm_up(timeout) for p in self.providers), return_exceptions=True)
+        for provider, result in zip(self.providers, results):
+            if isinstance(result, Exception):
+                logger.warning("Warm-up of LLM provider %s failed: %s", provider.name, result)
+        return any(result is True for result in results)
+
+    async def close(self) -> None:
+        await asyncio.gather(*(p.close() for p in self.providers), return_exceptions=True)
+
+
+def mock_response(prompt: str) -> str:
+    """
+    Generate a mock response for demo purposes when no API key is available
+    Enhanced to respond in the detected language
+    """
+    # Extract user question from prompt for better mock responses
+    if "CUSTOMER QUESTION" in prompt:
+        # Check if language is mentioned in prompt and respond accordingly
+        if "spanish" in prompt.lower():
+            if "batería" in prompt.lower() or "battery" in prompt.lower():
+                return "Según las especificaciones del producto, la duración de la batería es de hasta 10 horas para uso típico. Para juegos o tareas intensivas, puede esperar de 4 a 6 horas de duración de la batería."
+            elif "precio" in prompt.lower() or "cost" in prompt.lower():
+                return "El precio actual de este producto es $1,299.99. Por favor, consulte nuestro sitio web para conocer las promociones o descuentos actuales que puedan estar disponibles."
+            else:
+                return "Gracias por su pregunta. Según la información del producto, este UltraBook Pro 15 es una laptop de alto rendimiento para profesionales con especificaciones avanzadas."
+
+        elif "french" in prompt.lower():
+            if "batterie" in prompt.lower() or "battery" in prompt.lower():
+                return "Selon les spécifications du produit, l'autonomie de la batterie est jusqu'à 10 heures pour une utilisation normale. Pour les jeux ou les tâches intensives, vous pouvez vous attendre à 4-6 heures d'autonomie."
+            elif "prix" in prompt.lower() or "cost" in prompt.lower():
+                return "Le prix actuel de ce produit est de 1 299,99 $. Veuillez consulter notre site web pour connaître les promotions ou remises actuellement disponibles."
+            else:
+                return "Merci pour votre question. Selon les informations sur le produit, cet UltraBook Pro 15 est un ordinateur portable haute performance pour les professionnels."
+
+        elif "german" in prompt.lower():
+            if "batterie" in prompt.lower() or "akku" in prompt.lower():
+                return "Laut den Produktspezifikationen beträgt die Akkulaufzeit bis zu 10 Stunden bei typischer Nutzung. Für Gaming oder intensive Aufgaben können Sie 4-6 Stunden Akkulaufzeit erwarten."
+            elif "preis" in prompt.lower() or "cost" in prompt.lower():
+                return "Der aktuelle Preis für dieses Produkt beträgt 1.299,99 $. Bitte besuchen Sie unsere Website für aktuelle Werbeaktionen oder Rabatte."
+            else:
+                return "Vielen Dank für Ihre Frage. Laut den Produktinformationen ist dieses UltraBook Pro 15 ein Hochleistungs-Laptop für Profis."
+
+        elif "chinese" in prompt.lower():
+            if "电池" in prompt or "battery" in prompt.lower():
+                return "根据产品规格，电池续航时间为典型使用情况下最长10小时。对于游戏或密集任务，您可以期望4-6小时的电池续航时间。"
+            elif "价格" in prompt or "cost" in prompt.lower():
+                return "此产品的当前价格为$1,299.99。请查看我们的网站了解可能提供的当前促销或折扣。"
+            else:
+                return "感谢您的提问！根据产品信息，这款UltraBook Pro 15是一款专为专业人士设计的高性能笔记本电脑。"
+
+        elif "hindi" in prompt.lower():
+            if "बैटरी" in prompt or "battery" in prompt.lower():
+                return "उत्पाद विनिर्देशों के अनुसार, सामान्य उपयोग के लिए बैटरी जीवन 10 घंटे तक है। गेमिंग या गहन कार्यों के लिए, आप 4-6 घंटे की बैटरी जीवन की उम्मीद कर सकते हैं।"
+            elif "कीमत" in prompt or "price" in prompt.lower():
+                return "इस उत्पाद की वर्तमान कीमत $1,299.99 है। कृपया हमारी वेबसाइट पर उपलब्ध वर्तमान प्रचार या छूट के लिए जांच करें।"
+            else:
+                return "आपके प्रश्न के लिए धन्यवाद। उत्पाद की जानकारी के अनुसार, यह UltraBook Pro 15 पेशेवरों के लिए एक उच्च-प्रदर्शन लैपटॉप है।"
+
+        # Default English responses for unrecognized languages or English
+        user_question = prompt.split("CUSTOMER QUESTION")[-1].strip().lower()
+        if "battery" in user_question:
+            return "Based on the product specifications, the battery life is up to 10 hours for typical usage. For gaming or intensive tasks, you can expect 4-6 hours of battery life."
+        elif "warranty" in user_question:
+            return "This product comes with a 2-year limited warranty covering manufacturing defects. Physical damage and normal wear are not covered. You can contact customer support for warranty claims."
+        elif "price" in user_question or "cost" in user_question:
+            return "The current price for this product is $1,299.99. Please check our website for any current promotions or discounts that may be available."
+        elif "specs" in user_question or "specification" in user_question:
+            return "This product features high-end specifications including Intel i7 processor, 16GB RAM, and 512GB SSD storage. For complete technical specifications, please refer to the product manual."
+        else:
+            return "Thank you for your question! I'd be happy to help you with information about this product. For the most accurate and up-to-date information, please contact our customer support team."
+
+    return "Hello! I'm here to help answer questions about this product. What would you like to know?"
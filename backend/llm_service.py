@@ -1,37 +1,112 @@
+import asyncio
+import logging
 import os
-from groq import Groq
-from typing import Dict, Any, Tuple, Optional
+import time
+import httpx
+from dataclasses import dataclass
+from typing import Dict, Any, List, Tuple, Optional, AsyncIterator, Awaitable, Callable
 from dotenv import load_dotenv
-from langdetect import detect, LangDetectException
-from deep_translator import GoogleTranslator
+
+from translation_cache import translation_cache
+from translators import load_translator
+from language_detection import LanguageDetector, parse_accept_language
+from cpu_pool import nlp_pool, PoolSaturatedError
+from llm_providers import (LLMProvider, Completion, ProviderError, ProviderRateLimitError, ProviderPool,
+                           load_providers)
+from llm_limiter import LLMLimiter, LLMOverloadedError
+from retry import RetryBudget, backoff_delay
+from tracing import span
+from logging_config import redact
+from latency import LatencyByKey
+from model_router import ModelTier, load_router
+from metrics import LLM_LATENCY, LLM_HEDGES, LLM_REJECTED, LLM_RETRIES, TRANSLATION_CALLS, LANGUAGE_DETECTION_LATENCY, record_llm_usage
 
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+@dataclass
+class LLMResult:
+    """
+    Outcome of a single LLM generation
+    ok is False when the answer is an apology produced after an LLM error,
+    so callers know not to cache it
+    """
+    answer: str
+    ok: bool = True
+    latency_ms: float = 0.0
+    usage: Optional[Dict[str, Any]] = None
+
 class LLMService:
     """
-    Service for handling LLM API calls with context-rich prompts using Groq
-    with multilingual support
+    Service for handling LLM API calls with context-rich prompts across LLM providers
+    (Groq, OpenAI-compatible, local HTTP, mock) with multilingual support
     """
 
     def __init__(self):
-        # Configure Groq API
-        api_key = os.getenv("GROQ_API_KEY")
-        self.client = None
-        self.use_mock = True
+        # Per-call timeouts (seconds) and connection pool limits for each provider's HTTP client
+        self.request_timeout = float(os.getenv("LLM_REQUEST_TIMEOUT", "30"))
+        self.connect_timeout = float(os.getenv("LLM_CONNECT_TIMEOUT", "5"))
+        self.max_connections = int(os.getenv("LLM_MAX_CONNECTIONS", "200"))
+        self.max_keepalive_connections = int(os.getenv("LLM_MAX_KEEPALIVE_CONNECTIONS", "50"))
+        self.max_retries = int(os.getenv("LLM_MAX_RETRIES", "2"))
+
+        # Retries with jittered exponential backoff, capped by a budget relative to traffic
+        self.retry_base_delay = float(os.getenv("LLM_RETRY_BASE_DELAY_SECONDS", "0.2"))
+        self.retry_max_delay = float(os.getenv("LLM_RETRY_MAX_DELAY_SECONDS", "2"))
+        self.retry_budget = RetryBudget(ratio=float(os.getenv("LLM_RETRY_BUDGET_RATIO", "0.2")))
+
+        # Process-wide cap on concurrent LLM calls with a bounded wait queue
+        self.limiter = LLMLimiter(
+            max_in_flight=int(os.getenv("LLM_MAX_IN_FLIGHT", "32")),
+            max_queue=int(os.getenv("LLM_MAX_QUEUE", "64")),
+            max_wait=float(os.getenv("LLM_MAX_QUEUE_WAIT_SECONDS", "5"))
+        )
 
-        if api_key:
-            try:
-                self.client = Groq(api_key=api_key)
-                self.use_mock = False
-                print("Groq client initialized successfully.")
-            except Exception as e:
-                print(f"Failed to initialize Groq client: {e}")
-                print("Using mock responses for demo.")
-                self.client = None
-                self.use_mock = True
-        else:
-            print("Warning: No GROQ_API_KEY found. Using mock responses for demo.")
+        # Hedging: when a call is slower than the LLM_HEDGE_PERCENTILE of recent calls, send a
+        # second copy and keep whichever answers first; at most LLM_HEDGE_MAX_RATE of calls are hedged
+        self.hedging = os.getenv("LLM_HEDGING", "false").lower() == "true"
+        self.hedge_percentile = float(os.getenv("LLM_HEDGE_PERCENTILE", "0.95"))
+        self.hedge_min_delay_ms = float(os.getenv("LLM_HEDGE_MIN_DELAY_MS", "200"))
+        self.hedge_min_samples = int(os.getenv("LLM_HEDGE_MIN_SAMPLES", "20"))
+        self.hedge_budget = RetryBudget(ratio=float(os.getenv("LLM_HEDGE_MAX_RATE", "0.05")),
+                                        min_per_second=0.0, max_tokens=5.0)
+        # Per-tier API latency: a slow 70B call must not set the hedge delay for 8B calls
+        self.api_latency = LatencyByKey(500)
+        self.hedges_fired = 0
+        self.hedges_won = 0
+
+        # Model tier (model, max_tokens, temperature) chosen per question by cheap heuristics
+        self.router = load_router()
+        self.tier_latency = LatencyByKey(500)
+        self.tier_tokens: Dict[str, Dict[str, int]] = {}
+
+        # LLM backends listed in LLM_PROVIDERS (mock when none is configured). Each call goes to
+        # the first healthy provider unless another is clearly faster; a provider's circuit
+        # opens after consecutive failures
+        self.providers = ProviderPool(
+            load_providers(
+                timeout=self._timeout(),
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections
+            ),
+            failure_threshold=int(os.getenv("LLM_CIRCUIT_FAILURE_THRESHOLD", "5")),
+            reset_timeout=float(os.getenv("LLM_CIRCUIT_RESET_SECONDS", "30")),
+            explore_rate=float(os.getenv("LLM_PROVIDER_EXPLORE_RATE", "0.05")),
+            latency_tolerance=float(os.getenv("LLM_PROVIDER_LATENCY_TOLERANCE", "0.25"))
+        )
+        self.use_mock = self.providers.use_mock
+
+        # Translation backend selected by TRANSLATOR_BACKEND (google, identity, local)
+        self.translator = load_translator()
+
+        # Memoized language detection with a script/ASCII fast path
+        self.language_detector = LanguageDetector(
+            cache_size=int(os.getenv("LANGUAGE_DETECTION_CACHE_SIZE", "4096"))
+        )
+        # Use the browser's Accept-Language as a hint when detection is inconclusive
+        self.accept_language_hint = os.getenv("LANGUAGE_HINT_FROM_ACCEPT_LANGUAGE", "false").lower() == "true"
 
         # Language mapping for better detection and translation
         self.language_map = {
@@ -57,55 +132,184 @@ class LLMService:
             'ms': 'malay'
         }
 
-    def detect_language(self, text: str) -> str:
+    def _timeout(self, total: Optional[float] = None) -> httpx.Timeout:
+        """
+        Build the httpx timeout used for LLM calls
+        """
+        return httpx.Timeout(total or self.request_timeout, connect=self.connect_timeout)
+
+    async def close(self):
+        """
+        Close the providers' HTTP connection pools and the translation cache
+        """
+        await self.providers.close()
+        translation_cache.close()
+
+    async def warm_up(self) -> bool:
+        """
+        Open a connection to each LLM provider (DNS, TLS handshake) before the first chat
+        request needs it; returns False when running on mock responses
+        """
+        if self.use_mock:
+            return False
+        return await self.providers.warm_up(self._timeout(self.connect_timeout * 2))
+
+    def detect_language(self, text: str, hint: Optional[str] = None) -> str:
         """
         Detect the language of the input text
         Returns ISO 639-1 language code (e.g., 'en', 'es', 'fr')
         """
         try:
-            detected = detect(text)
-            print(f"Detected language: {detected}")
+            detected = self.language_detector.detect(text, hint)
+            logger.debug("Detected language %s", detected)
             return detected
-        except LangDetectException:
-            print("Could not detect language, defaulting to English")
-            return 'en'
         except Exception as e:
-            print(f"Language detection error: {e}")
+            logger.warning("Language detection error: %s", e)
             return 'en'
 
-    def translate_text(self, text: str, source_lang: str, target_lang: str) -> str:
+    async def detect_language_async(self, text: str, hint: Optional[str] = None,
+                                    fallback: Optional[str] = None) -> str:
+        """
+        detect_language without blocking the event loop
+        Fast-path and memoized results return inline; langdetect runs on the NLP pool.
+        When the pool is saturated, returns fallback (or hint, or English) instead of queueing
+        """
+        with span("detect_language"):
+            started = time.perf_counter()
+            detected = self.language_detector.detect_cached(text, hint)
+            if detected is not None:
+                LANGUAGE_DETECTION_LATENCY.labels("cached").observe(time.perf_counter() - started)
+                return detected
+
+            try:
+                detected = await nlp_pool.run(self.detect_language, text, hint)
+                LANGUAGE_DETECTION_LATENCY.labels("model").observe(time.perf_counter() - started)
+                return detected
+            except PoolSaturatedError:
+                detected = fallback or hint or 'en'
+                LANGUAGE_DETECTION_LATENCY.labels("saturated").observe(time.perf_counter() - started)
+                logger.warning("Language detection pool saturated, using %s", detected)
+                return detected
+
+    async def translate_text_async(self, text: str, source_lang: str, target_lang: str) -> str:
+        """
+        translate_text without blocking the event loop; memory cache hits return inline,
+        the disk cache lookup and the backend call run in a worker thread
+        """
+        if source_lang == target_lang:
+            return text
+        with span("translate"):
+            cached = translation_cache.get_memory(text, source_lang, target_lang, self.translator.name)
+            if cached is not None:
+                return cached
+            return await asyncio.to_thread(self.translate_text, text, source_lang, target_lang)
+
+    def translate_text(self, text: str, source_lang: str, target_lang: str,
+                       strict: bool = False) -> str:
         """
         Translate text from source language to target language
+        On failure the original text is returned, or the error is raised when strict
         """
         if source_lang == target_lang:
             return text
 
+        backend = self.translator.name
+        cached = translation_cache.get(text, source_lang, target_lang, backend)
+        if cached is not None:
+            return cached
+
         try:
-            # GoogleTranslator uses 'auto' for automatic detection
-            src = 'auto' if source_lang == 'auto' else source_lang
-            translator = GoogleTranslator(source=src, target=target_lang)
-            translated = translator.translate(text)
-            print(f"Translated from {source_lang} to {target_lang}")
+            translated = self.translator.translate(text, source_lang, target_lang)
+            TRANSLATION_CALLS.labels(backend, "ok").inc()
+            logger.debug("Translated %s -> %s", source_lang, target_lang)
+            if translated:
+                translation_cache.set(text, source_lang, target_lang, translated, backend)
             return translated
         except Exception as e:
-            print(f"Translation error: {e}")
+            TRANSLATION_CALLS.labels(backend, "error").inc()
+            if strict:
+                raise
+            logger.warning("Translation %s -> %s failed: %s", source_lang, target_lang, e)
             return text
 
+    def translate_batch(self, texts: List[str], source_lang: str, target_lang: str,
+                        strict: bool = False) -> List[str]:
+        """
+        Translate many strings with one backend call for all cache misses
+        On failure the original texts are returned, or the error is raised when strict
+        """
+        if source_lang == target_lang or not texts:
+            return list(texts)
+
+        backend = self.translator.name
+        results = [translation_cache.get(text, source_lang, target_lang, backend) for text in texts]
+        missing = [i for i, result in enumerate(results) if result is None]
+        if not missing:
+            return results
+
+        try:
+            translated = self.translator.translate_batch([texts[i] for i in missing], source_lang, target_lang)
+            TRANSLATION_CALLS.labels(backend, "ok").inc()
+            logger.debug("Translated %d text(s) %s -> %s", len(missing), source_lang, target_lang)
+        except Exception as e:
+            TRANSLATION_CALLS.labels(backend, "error").inc()
+            if strict:
+                raise
+            logger.warning("Translation %s -> %s failed: %s", source_lang, target_lang, e)
+            translated = [texts[i] for i in missing]
+        else:
+            for i, result in zip(missing, translated):
+                if result:
+                    translation_cache.set(texts[i], source_lang, target_lang, result, backend)
+
+        for i, result in zip(missing, translated):
+            results[i] = result or texts[i]
+        return results
+
+    def resolve_language(self, user_question: str, response_language: Optional[str] = None,
+                         accept_language: Optional[str] = None) -> str:
+        """
+        Return the requested response language, or detect it from the question
+        accept_language (the raw Accept-Language header) is used as a detection hint
+        when LANGUAGE_HINT_FROM_ACCEPT_LANGUAGE is enabled
+        """
+        if response_language:
+            return response_language
+
+        hint = None
+        if self.accept_language_hint:
+            hint = parse_accept_language(accept_language, self.language_map)
+        return self.detect_language(user_question, hint)
+
+    async def resolve_language_async(self, user_question: str, response_language: Optional[str] = None,
+                                     accept_language: Optional[str] = None) -> str:
+        """
+        resolve_language without blocking the event loop
+        If the detection pool is saturated the Accept-Language language is used, else English
+        """
+        if response_language:
+            return response_language
+
+        declared = parse_accept_language(accept_language, self.language_map)
+        hint = declared if self.accept_language_hint else None
+        return await self.detect_language_async(user_question, hint, fallback=declared)
+
     def create_context_prompt(self, product_data: Dict[str, Any], user_question: str,
-                            response_language: Optional[str] = None) -> Tuple[str, str]:
+                            response_language: Optional[str] = None,
+                            faqs: Optional[List[Dict[str, Any]]] = None) -> Tuple[str, str]:
         """
         Create a context-rich prompt combining product info and user question
         with direct language processing (no translation of user question)
+        faqs overrides product_data['faqs'], e.g. with only the FAQs relevant to the question
         Returns: (prompt, detected_language)
         """
         # Detect language of user question
-        detected_lang = self.detect_language(user_question) if not response_language else response_language
+        detected_lang = self.resolve_language(user_question, response_language)
 
         # Get full language name for the prompt
         lang_name = self.language_map.get(detected_lang, detected_lang)
 
-        print(f"Detected language: {detected_lang} ({lang_name})")
-        print(f"Sending original question directly to LLM: {user_question}")
+        logger.debug("Building prompt in %s for question %r", lang_name, redact(user_question))
 
         prompt_template = """
 You are a helpful product support assistant. Answer the customer's question based on the product information provided below.
@@ -135,7 +339,7 @@ Remember: Your ENTIRE response must be in {language}. Keep your response convers
         # Format FAQs for context
         faqs_text = "\n".join([
             f"Q: {faq['question']}\nA: {faq['answer']}\n"
-            for faq in product_data.get('faqs', [])
+            for faq in (faqs if faqs is not None else product_data.get('faqs', []))
         ])
 
         prompt = prompt_template.format(
@@ -154,107 +358,369 @@ Remember: Your ENTIRE response must be in {language}. Keep your response convers
 
         return prompt, detected_lang
 
-    async def get_response(self, prompt: str, target_language: str = 'en') -> str:
+    async def get_response(self, prompt: str, target_language: str = 'en',
+                           timeout: Optional[float] = None) -> str:
         """
         Send prompt to LLM and get response, ensuring it's in the target language
+        Optional timeout (seconds) overrides LLM_REQUEST_TIMEOUT for this call
+        """
+        result = await self.generate(prompt, target_language, timeout)
+        return result.answer
+
+    @staticmethod
+    def _overloaded_from_rate_limit(error: ProviderRateLimitError) -> LLMOverloadedError:
+        """Turn a provider 429 into LLMOverloadedError, keeping the provider's Retry-After"""
+        return LLMOverloadedError("LLM provider rate limit reached", status_code=429, retry_after=error.retry_after)
+
+    def route(self, question: str, faq_score: float = 0.0) -> ModelTier:
+        """
+        Model tier for a question; faq_score is the best FAQ match for it (0..1)
+        """
+        return self.router.route(question, faq_score)
+
+    def _record_tier(self, tier: ModelTier, latency_ms: float, usage: Optional[Dict[str, Any]]) -> None:
+        self.tier_latency.record(tier.name, latency_ms)
+        record_llm_usage(usage, tier.name)
+        if usage:
+            tokens = self.tier_tokens.setdefault(tier.name, {"prompt": 0, "completion": 0})
+            tokens["prompt"] += usage.get("prompt_tokens") or 0
+            tokens["completion"] += usage.get("completion_tokens") or 0
+
+    def routing_stats(self) -> Dict[str, Any]:
+        stats = self.router.stats()
+        stats["latency"] = self.tier_latency.summary()
+        stats["tokens"] = {name: dict(tokens) for name, tokens in self.tier_tokens.items()}
+        return stats
+
+    async def generate(self, prompt: str, target_language: str = 'en',
+                       timeout: Optional[float] = None, tier: Optional[ModelTier] = None) -> LLMResult:
         """
+        Same as get_response but returns an LLMResult with success flag, latency and usage
+        tier selects model, max_tokens and temperature (the standard tier by default).
+        Transient API errors are retried with jittered backoff within timeout, on another
+        provider when one is healthy; while every provider's circuit is open the call fails
+        fast with ok=False so callers can fall back.
+        Raises LLMOverloadedError when no LLM slot frees up in time or the provider
+        rate-limits us, so callers can answer 429/503 instead of an apology
+        """
+        started = time.perf_counter()
+        tier = tier or self.router.default
+
         if self.use_mock:
             # Return a mock response for demo purposes
-            response = self._get_mock_response(prompt)
+            async with self.limiter.slot():
+                with span("llm_api"):
+                    response = await self._mock_response(prompt, tier)
             # Translate mock response to target language if needed
             if target_language != 'en':
-                response = self.translate_text(response, 'en', target_language)
-            return response
+                response = await self.translate_text_async(response, 'en', target_language)
+            return LLMResult(answer=response, latency_ms=(time.perf_counter() - started) * 1000)
+
+        if not self.providers.available():
+            LLM_REJECTED.labels("circuit_open").inc()
+            error_msg = await self._error_message("LLM temporarily unavailable", target_language)
+            return LLMResult(answer=error_msg, ok=False, latency_ms=(time.perf_counter() - started) * 1000)
 
         try:
-            response = self.client.chat.completions.create(
-                model="llama-3.1-8b-instant",  # Fast Groq model
-                messages=[
-                    {"role": "system", "content": f"You are a helpful product support assistant. Always respond in the language requested by the user."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=500,
-                temperature=0.3
+            completion = await self._create_completion(prompt, timeout, tier)
+
+            LLM_LATENCY.labels("complete", "ok", tier.name).observe(time.perf_counter() - started)
+            usage = completion.usage
+            self._record_tier(tier, (time.perf_counter() - started) * 1000, usage)
+            llm_response = await self.ensure_language(completion.text.strip(), target_language)
+
+            return LLMResult(
+                answer=llm_response,
+                latency_ms=(time.perf_counter() - started) * 1000,
+                usage=usage
             )
 
-            llm_response = response.choices[0].message.content.strip()
+        except LLMOverloadedError:
+            # Overload is surfaced to the caller (429/503), never turned into an apology
+            raise
 
-            # Check if response is in the correct language
-            # If the LLM didn't respond in the correct language, translate it
-            if target_language != 'en':
-                detected_response_lang = self.detect_language(llm_response[:100])  # Check first 100 chars
-                if detected_response_lang != target_language:
-                    print(f"LLM responded in {detected_response_lang}, translating to {target_language}")
-                    llm_response = self.translate_text(llm_response, detected_response_lang, target_language)
+        except ProviderRateLimitError as e:
+            LLM_LATENCY.labels("complete", "rate_limited", tier.name).observe(time.perf_counter() - started)
+            raise self._overloaded_from_rate_limit(e)
 
+        except Exception as e:
+            LLM_LATENCY.labels("complete", "error", tier.name).observe(time.perf_counter() - started)
+            error_msg = await self._error_message(e, target_language)
+            return LLMResult(answer=error_msg, ok=False, latency_ms=(time.perf_counter() - started) * 1000)
+
+    async def ensure_language(self, llm_response: str, target_language: str) -> str:
+        """
+        Check if the LLM response is in the target language and translate it if it is not
+        Answers requested in English are returned unchecked
+        """
+        if target_language == 'en':
             return llm_response
+        # Check first 100 chars; assume the requested language if the pool is saturated
+        with span("response_language_check"):
+            detected_response_lang = await self.detect_language_async(llm_response[:100], fallback=target_language)
+        if detected_response_lang != target_language:
+            logger.info("LLM responded in %s, translating to %s", detected_response_lang, target_language)
+            llm_response = await self.translate_text_async(llm_response, detected_response_lang, target_language)
+        return llm_response
+
+    async def _mock_response(self, prompt: str, tier: ModelTier) -> str:
+        completion = await self.providers.providers[0].complete(prompt, tier, self._timeout())
+        return completion.text
+
+    def _next_provider(self, tier: ModelTier, tried: List[LLMProvider],
+                       rate_limited: Optional[ProviderRateLimitError]) -> LLMProvider:
+        """
+        Fastest healthy provider not yet tried for this request (a tried one when none is left)
+        Raises the last 429 once every healthy provider has rate-limited the request
+        """
+        provider = self.providers.select(tier.name, avoid=tried)
+        if provider is None:
+            raise ProviderError("No healthy LLM provider", retryable=False)
+        if rate_limited is not None and provider in tried:
+            raise rate_limited
+        return provider
+
+    async def _create_completion(self, prompt: str, timeout: Optional[float], tier: ModelTier) -> Completion:
+        """
+        Chat completion with retries on connection errors, timeouts and 5xx
+        Retries and rate-limited calls move to another provider when one is healthy;
+        all attempts together stay within timeout (LLM_REQUEST_TIMEOUT by default)
+        """
+        deadline = time.monotonic() + (timeout or self.request_timeout)
+        self.retry_budget.deposit()
+        attempt = 0
+        tried: List[LLMProvider] = []
+        rate_limited = None
+        while True:
+            provider = self._next_provider(tier, tried, rate_limited)
+            try:
+                if self.hedging:
+                    return await self._hedged(
+                        lambda hedge: self._api_call(self._hedge_provider(tier, provider) if hedge else provider,
+                                                     prompt, deadline, tier),
+                        tier.name
+                    )
+                return await self._api_call(provider, prompt, deadline, tier)
+            except ProviderRateLimitError as e:
+                # Another provider may have capacity; the 429 reaches the client only when none does
+                tried.append(provider)
+                rate_limited = e
+            except ProviderError as e:
+                tried.append(provider)
+                delay = self._retry_delay(attempt, deadline, e) if e.retryable else None
+                if delay is None:
+                    raise
+                attempt += 1
+                await asyncio.sleep(delay)
+
+    async def _api_call(self, provider: LLMProvider, prompt: str, deadline: float, tier: ModelTier) -> Completion:
+        """
+        One provider call; its outcome and latency feed provider selection and the tier's hedge delay
+        """
+        # Only the API call holds a concurrency slot, not the backoff sleep
+        async with self.limiter.slot():
+            with span("llm_api"):
+                started = time.perf_counter()
+                try:
+                    completion = await provider.complete(prompt, tier, self._timeout(deadline - time.monotonic()))
+                except ProviderRateLimitError:
+                    self.providers.record_rate_limited(provider)
+                    raise
+                except Exception:
+                    self.providers.record_failure(provider, (time.perf_counter() - started) * 1000)
+                    raise
+        latency_ms = (time.perf_counter() - started) * 1000
+        self.providers.record_success(provider, tier.name, latency_ms)
+        self.api_latency.record(tier.name, latency_ms)
+        return completion
+
+    def _hedge_provider(self, tier: ModelTier, primary: LLMProvider) -> LLMProvider:
+        """A hedge goes to the next healthy provider, or to the same one when it is the only one"""
+        return self.providers.select(tier.name, avoid=[primary]) or primary
+
+    def hedge_delay_ms(self, tier_name: str = "standard") -> Optional[float]:
+        """
+        How long to wait before hedging: the configured percentile of the tier's recent call latency
+        None until enough calls have been seen to estimate it
+        """
+        window = self.api_latency.window(tier_name)
+        if window is None or window.count < self.hedge_min_samples:
+            return None
+        return max(self.hedge_min_delay_ms, window.percentile(self.hedge_percentile))
 
-        except Exception as e:
-            error_msg = f"I apologize, but I'm having trouble processing your request right now. Please try again later or contact customer support. Error: {str(e)}"
-            # Translate error message to target language
+    async def _hedged(self, call: Callable[[bool], Awaitable[Any]], tier_name: str = "standard") -> Any:
+        """
+        Run call(False); if it is still running after hedge_delay_ms, start call(True) and
+        return whichever succeeds first, cancelling the other
+        """
+        self.hedge_budget.deposit()
+        delay_ms = self.hedge_delay_ms(tier_name)
+        primary = asyncio.create_task(call(False))
+        if delay_ms is None:
+            return await primary
+
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay_ms / 1000)
+            # A hedge never queues behind other requests and never exceeds the hedge rate
+            if done or self.limiter.free_slots <= 0 or not self.hedge_budget.withdraw():
+                if not done:
+                    LLM_HEDGES.labels("skipped").inc()
+                return await primary
+
+            self.hedges_fired += 1
+            LLM_HEDGES.labels("fired").inc()
+            hedge = asyncio.create_task(call(True))
+            tasks.add(hedge)
+            error = None
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self.hedges_won += 1
+                            LLM_HEDGES.labels("won").inc()
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def hedge_stats(self) -> Dict[str, Any]:
+        delays = {name: self.hedge_delay_ms(name) for name in self.router.tiers}
+        return {
+            "enabled": self.hedging,
+            "delay_ms": {name: round(delay, 1) if delay is not None else None for name, delay in delays.items()},
+            "fired": self.hedges_fired,
+            "won": self.hedges_won,
+            "budget": self.hedge_budget.stats(),
+            "api_latency": self.api_latency.summary(),
+        }
+
+    def _retry_delay(self, attempt: int, deadline: float, error: Exception) -> Optional[float]:
+        """
+        Backoff before the next attempt, or None when out of attempts, time or retry budget
+        """
+        if attempt >= self.max_retries:
+            return None
+        delay = backoff_delay(attempt, self.retry_base_delay, self.retry_max_delay)
+        # The next attempt needs at least a connect timeout's worth of time
+        if time.monotonic() + delay + self.connect_timeout > deadline:
+            return None
+        if not self.retry_budget.withdraw():
+            LLM_REJECTED.labels("retry_budget").inc()
+            return None
+        LLM_RETRIES.inc()
+        logger.info("LLM call failed (%s), retry %d in %.0f ms", type(error).__name__, attempt + 1, delay * 1000)
+        return delay
+
+    async def _error_message(self, error: Any, target_language: str) -> str:
+        """
+        Apology returned when the LLM call failed, in the target language
+        """
+        error_msg = f"I apologize, but I'm having trouble processing your request right now. Please try again later or contact customer support. Error: {str(error)}"
+        if target_language != 'en':
+            error_msg = await self.translate_text_async(error_msg, 'en', target_language)
+        return error_msg
+
+    async def stream_response(self, prompt: str, target_language: str = 'en',
+                              timeout: Optional[float] = None,
+                              tier: Optional[ModelTier] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream the LLM response as it is generated
+        Yields {"type": "token", "text": ...} events followed by a single
+        {"type": "done", "usage": {...}} event with token usage when available
+        Opening the stream is retried like generate(); once tokens have been sent it is not
+        """
+        tier = tier or self.router.default
+        if self.use_mock:
+            try:
+                async with self.limiter.slot():
+                    response = await self._mock_response(prompt, tier)
+            except LLMOverloadedError as e:
+                # Same events as the provider path, so load tests see the stream end cleanly
+                yield {"type": "error", "text": str(e), "status_code": e.status_code, "retry_after": e.retry_after}
+                yield {"type": "done", "usage": None}
+                return
             if target_language != 'en':
-                error_msg = self.translate_text(error_msg, 'en', target_language)
-            return error_msg
-
-    def _get_mock_response(self, prompt: str) -> str:
-        """
-        Generate a mock response for demo purposes when no API key is available
-        Enhanced to respond in the detected language
-        """
-        # Extract user question from prompt for better mock responses
-        if "CUSTOMER QUESTION" in prompt:
-            # Check if language is mentioned in prompt and respond accordingly
-            if "spanish" in prompt.lower():
-                if "batería" in prompt.lower() or "battery" in prompt.lower():
-                    return "Según las especificaciones del producto, la duración de la batería es de hasta 10 horas para uso típico. Para juegos o tareas intensivas, puede esperar de 4 a 6 horas de duración de la batería."
-                elif "precio" in prompt.lower() or "cost" in prompt.lower():
-                    return "El precio actual de este producto es $1,299.99. Por favor, consulte nuestro sitio web para conocer las promociones o descuentos actuales que puedan estar disponibles."
-                else:
-                    return "Gracias por su pregunta. Según la información del producto, este UltraBook Pro 15 es una laptop de alto rendimiento para profesionales con especificaciones avanzadas."
-
-            elif "french" in prompt.lower():
-                if "batterie" in prompt.lower() or "battery" in prompt.lower():
-                    return "Selon les spécifications du produit, l'autonomie de la batterie est jusqu'à 10 heures pour une utilisation normale. Pour les jeux ou les tâches intensives, vous pouvez vous attendre à 4-6 heures d'autonomie."
-                elif "prix" in prompt.lower() or "cost" in prompt.lower():
-                    return "Le prix actuel de ce produit est de 1 299,99 $. Veuillez consulter notre site web pour connaître les promotions ou remises actuellement disponibles."
-                else:
-                    return "Merci pour votre question. Selon les informations sur le produit, cet UltraBook Pro 15 est un ordinateur portable haute performance pour les professionnels."
-
-            elif "german" in prompt.lower():
-                if "batterie" in prompt.lower() or "akku" in prompt.lower():
-                    return "Laut den Produktspezifikationen beträgt die Akkulaufzeit bis zu 10 Stunden bei typischer Nutzung. Für Gaming oder intensive Aufgaben können Sie 4-6 Stunden Akkulaufzeit erwarten."
-                elif "preis" in prompt.lower() or "cost" in prompt.lower():
-                    return "Der aktuelle Preis für dieses Produkt beträgt 1.299,99 $. Bitte besuchen Sie unsere Website für aktuelle Werbeaktionen oder Rabatte."
-                else:
-                    return "Vielen Dank für Ihre Frage. Laut den Produktinformationen ist dieses UltraBook Pro 15 ein Hochleistungs-Laptop für Profis."
-
-            elif "chinese" in prompt.lower():
-                if "电池" in prompt or "battery" in prompt.lower():
-                    return "根据产品规格，电池续航时间为典型使用情况下最长10小时。对于游戏或密集任务，您可以期望4-6小时的电池续航时间。"
-                elif "价格" in prompt or "cost" in prompt.lower():
-                    return "此产品的当前价格为$1,299.99。请查看我们的网站了解可能提供的当前促销或折扣。"
-                else:
-                    return "感谢您的提问！根据产品信息，这款UltraBook Pro 15是一款专为专业人士设计的高性能笔记本电脑。"
-
-            elif "hindi" in prompt.lower():
-                if "बैटरी" in prompt or "battery" in prompt.lower():
-                    return "उत्पाद विनिर्देशों के अनुसार, सामान्य उपयोग के लिए बैटरी जीवन 10 घंटे तक है। गेमिंग या गहन कार्यों के लिए, आप 4-6 घंटे की बैटरी जीवन की उम्मीद कर सकते हैं।"
-                elif "कीमत" in prompt or "price" in prompt.lower():
-                    return "इस उत्पाद की वर्तमान कीमत $1,299.99 है। कृपया हमारी वेबसाइट पर उपलब्ध वर्तमान प्रचार या छूट के लिए जांच करें।"
-                else:
-                    return "आपके प्रश्न के लिए धन्यवाद। उत्पाद की जानकारी के अनुसार, यह UltraBook Pro 15 पेशेवरों के लिए एक उच्च-प्रदर्शन लैपटॉप है।"
-
-            # Default English responses for unrecognized languages or English
-            user_question = prompt.split("CUSTOMER QUESTION")[-1].strip().lower()
-            if "battery" in user_question:
-                return "Based on the product specifications, the battery life is up to 10 hours for typical usage. For gaming or intensive tasks, you can expect 4-6 hours of battery life."
-            elif "warranty" in user_question:
-                return "This product comes with a 2-year limited warranty covering manufacturing defects. Physical damage and normal wear are not covered. You can contact customer support for warranty claims."
-            elif "price" in user_question or "cost" in user_question:
-                return "The current price for this product is $1,299.99. Please check our website for any current promotions or discounts that may be available."
-            elif "specs" in user_question or "specification" in user_question:
-                return "This product features high-end specifications including Intel i7 processor, 16GB RAM, and 512GB SSD storage. For complete technical specifications, please refer to the product manual."
-            else:
-                return "Thank you for your question! I'd be happy to help you with information about this product. For the most accurate and up-to-date information, please contact our customer support team."
-
-        return "Hello! I'm here to help answer questions about this product. What would you like to know?"
\ No newline at end of file
+                response = await self.translate_text_async(response, 'en', target_language)
+            # Emit word-sized chunks so clients exercise the same code path as a live stream
+            for i, word in enumerate(response.split(" ")):
+                yield {"type": "token", "text": word if i == 0 else f" {word}"}
+            yield {"type": "done", "usage": None}
+            return
+
+        if not self.providers.available():
+            LLM_REJECTED.labels("circuit_open").inc()
+            yield {"type": "error", "text": await self._error_message("LLM temporarily unavailable", target_language)}
+            yield {"type": "done", "usage": None}
+            return
+
+        usage = None
+        started = time.perf_counter()
+        deadline = time.monotonic() + (timeout or self.request_timeout)
+        self.retry_budget.deposit()
+        attempt = 0
+        tried: List[LLMProvider] = []
+        rate_limited = None
+        try:
+            while True:
+                provider = self._next_provider(tier, tried, rate_limited)
+                emitted = False
+                try:
+                    async with self.limiter.slot():
+                        async for event in self._provider_stream(provider, prompt, deadline, tier):
+                            if event["type"] == "usage":
+                                usage = event["usage"]
+                            else:
+                                emitted = True
+                                yield event
+                    break
+                except ProviderRateLimitError as e:
+                    if emitted:
+                        raise
+                    tried.append(provider)
+                    rate_limited = e
+                except ProviderError as e:
+                    tried.append(provider)
+                    delay = self._retry_delay(attempt, deadline, e) if e.retryable and not emitted else None
+                    if delay is None:
+                        raise
+                    attempt += 1
+                    await asyncio.sleep(delay)
+
+            LLM_LATENCY.labels("stream", "ok", tier.name).observe(time.perf_counter() - started)
+            self._record_tier(tier, (time.perf_counter() - started) * 1000, usage)
+
+        except LLMOverloadedError as e:
+            yield {"type": "error", "text": str(e), "status_code": e.status_code, "retry_after": e.retry_after}
+
+        except ProviderRateLimitError as e:
+            LLM_LATENCY.labels("stream", "rate_limited", tier.name).observe(time.perf_counter() - started)
+            overloaded = self._overloaded_from_rate_limit(e)
+            yield {"type": "error", "text": str(overloaded), "status_code": overloaded.status_code,
+                   "retry_after": overloaded.retry_after}
+
+        except Exception as e:
+            LLM_LATENCY.labels("stream", "error", tier.name).observe(time.perf_counter() - started)
+            yield {"type": "error", "text": await self._error_message(e, target_language)}
+
+        yield {"type": "done", "usage": usage}
+
+    async def _provider_stream(self, provider: LLMProvider, prompt: str, deadline: float,
+                               tier: ModelTier) -> AsyncIterator[Dict[str, Any]]:
+        """
+        One provider stream; its outcome feeds provider selection
+        """
+        started = time.perf_counter()
+        try:
+            async for event in provider.stream(prompt, tier, self._timeout(deadline - time.monotonic())):
+                yield event
+        except ProviderRateLimitError:
+            self.providers.record_rate_limited(provider)
+            raise
+        except Exception:
+            self.providers.record_failure(provider, (time.perf_counter() - started) * 1000)
+            raise
+        self.providers.record_success(provider, tier.name)
@@ -0,0 +1,117 @@
+import atexit
+import json
+import logging
+import os
+import queue
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# Characters of user-written text (questions) kept in log lines; 0 logs only the length
+LOG_USER_TEXT_CHARS = int(os.getenv("LOG_USER_TEXT_CHARS", "32"))
+
+# Attributes every LogRecord has; anything else was passed through extra=
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+_listener: Optional[QueueListener] = None
+
+
+def redact(text: Optional[str], max_chars: Optional[int] = None) -> str:
+    """
+    Shorten user-written text before it is logged
+    "How long does the battery last on a full charge?" -> "How long does the battery last o… (49 chars)"
+    """
+    if text is None:
+        return ""
+    max_chars = LOG_USER_TEXT_CHARS if max_chars is None else max_chars
+    if max_chars <= 0:
+        return f"<{len(text)} chars>"
+    if len(text) <= max_chars:
+        return text
+    return f"{text[:max_chars]}… ({len(text)} chars)"
+
+
+def _extra_fields(record: logging.LogRecord) -> Dict[str, Any]:
+    return {key: value for key, value in vars(record).items() if key not in _RECORD_ATTRS}
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line; fields passed with extra= become top-level keys"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        entry.update(_extra_fields(record))
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """Human-readable lines for local development; extra fields are appended as key=value"""
+
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)-7s %(name)s: %(message)s")
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        fields = _extra_fields(record)
+        if fields:
+            line += " " + " ".join(f"{key}={json.dumps(value, ensure_ascii=False, default=str)}"
+                                   for key, value in fields.items())
+        return line
+
+
+def parse_levels(spec: str) -> Dict[str, str]:
+    """"llm_service=DEBUG,translation_cache=WARNING" -> {"llm_service": "DEBUG", ...}"""
+    levels = {}
+    for part in spec.split(","):
+        name, _, level = part.partition("=")
+        if name.strip() and level.strip():
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def setup_logging() -> None:
+    """
+    Route all logging through a queue so request handlers never block on stdout;
+    a background listener thread does the formatting and writing
+
+    LOG_LEVEL sets the default level, LOG_LEVELS overrides it per module
+    (e.g. "llm_service=DEBUG,uvicorn.access=WARNING"), LOG_FORMAT is json or text.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(JsonFormatter() if os.getenv("LOG_FORMAT", "json").lower() == "json" else TextFormatter())
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.handlers = [QueueHandler(log_queue)]
+    root.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+    # httpx logs every LLM API request at INFO
+    for name, level in parse_levels(os.getenv("LOG_LEVELS", "httpx=WARNING")).items():
+        logging.getLogger(name).setLevel(level)
+
+    _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the listener thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
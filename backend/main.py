@@ -1,12 +1,34 @@
-from fastapi import FastAPI, Depends, HTTPException
+import asyncio
+import json
+import os
+import time
+from fastapi import FastAPI, Depends, HTTPException, BackgroundTasks, Header
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse, Response, JSONResponse
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Dict, Any, Optional, Tuple
 
-from database import get_db, create_tables
-from models import Product, FAQ
+from database import get_db, create_tables, engine
 from schemas import ProductResponse, ChatRequest, ChatResponse
 from llm_service import LLMService
+from llm_limiter import LLMOverloadedError
+from model_router import ModelTier
+from fallback import extractive_answer, FALLBACK_NOTICE
+from single_flight import SingleFlight
+from product_cache import product_cache, get_product_entry, CachedProduct, scan_counter
+from answer_cache import answer_cache
+from semantic_cache import semantic_cache
+from latency import LatencyByKey
+from translation_cache import translation_cache
+from cpu_pool import nlp_pool
+from warmup import run_warmup, warmup_state
+from readiness import loop_lag_monitor, db_pool_stats, check_readiness
+from tracing import span, start_trace, finish_trace, SERVER_TIMING_HEADER
+from logging_config import setup_logging, shutdown_logging
+from metrics import MetricsMiddleware, register_cache_stats, render_metrics, CONTENT_TYPE_LATEST
+
+# Structured logs written by a background thread, configured before anything logs
+setup_logging()
 
 app = FastAPI(title="QR Product Chatbot API", version="1.0.0")
 
@@ -22,75 +44,375 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Request counts and latency per route for /metrics
+app.add_middleware(MetricsMiddleware)
+
 # Initialize LLM service
 llm_service = LLMService()
 
-# Create tables on startup
+# Answer from product data instead of an apology when the LLM fails or its circuit is open
+EXTRACTIVE_FALLBACK = os.getenv("LLM_EXTRACTIVE_FALLBACK", "true").lower() == "true"
+
+# Concurrent identical questions (same product version, normalized question and
+# language) share one LLM call
+llm_flights = SingleFlight("chat_llm")
+
+# Answer latency distribution per source (faq, cache, semantic_cache, llm)
+answer_latency = LatencyByKey()
+
+# Cache hit ratios are read from the caches' own counters when /metrics is scraped
+register_cache_stats({
+    "product": product_cache.stats,
+    "answer": answer_cache.stats,
+    "semantic": semantic_cache.stats,
+    "translation": translation_cache.stats
+})
+
+# Background warm-up task, kept referenced so it is not garbage collected
+warmup_task: Optional[asyncio.Task] = None
+
+# Create tables on startup, then warm up caches and connections in the background
 @app.on_event("startup")
 async def startup_event():
+    global warmup_task
     create_tables()
+    loop_lag_monitor.start()
+    warmup_task = asyncio.create_task(run_warmup(llm_service))
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
+    loop_lag_monitor.stop()
+    scan_counter.save()
+    await llm_service.close()
+    nlp_pool.shutdown()
+    shutdown_logging()
+
+@app.exception_handler(LLMOverloadedError)
+async def llm_overloaded_handler(request, exc: LLMOverloadedError):
+    """Shed load with 429/503 and Retry-After instead of queueing or apologising"""
+    return JSONResponse(
+        status_code=exc.status_code,
+        content={"detail": str(exc), "retry_after": exc.retry_after},
+        headers={"Retry-After": str(exc.retry_after)}
+    )
+
+def sse_event(event: str, data: Dict[str, Any]) -> str:
+    """Format a single Server-Sent Event"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+async def find_answer_without_llm(entry: CachedProduct, question: str,
+                                  language: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Try the cheap answer paths in order: exact answer cache, stored FAQ, semantic cache
+    Returns (answer, source) or (None, None) when the LLM has to be called
+    """
+    # Repeated questions about the same product are served without an LLM call
+    answer = answer_cache.get(entry.product_id, entry.version, question, language)
+    if answer is not None:
+        return answer, "cache"
+
+    # Questions that closely match a stored FAQ get its answer directly
+    faq = entry.match_faq(question)
+    if faq is not None:
+        answer = faq["answer"]
+        faq_language = faq.get("language", entry.language)
+        if language != faq_language:
+            # No pre-translation for this language
+            answer = await llm_service.translate_text_async(answer, faq_language, language)
+        return answer, "faq"
+
+    # Paraphrases of earlier questions are matched by embedding similarity
+    answer = semantic_cache.lookup(entry.product_id, entry.version, question, language)
+    if answer is not None:
+        # Promoted to an exact match; no LLM latency, so it does not count as an LLM call
+        answer_cache.set(entry.product_id, entry.version, question, language, answer)
+        return answer, "semantic_cache"
+
+    return None, None
+
+def route_question(entry: CachedProduct, question: str) -> ModelTier:
+    """
+    Model tier for a question that needs the LLM, using its closest FAQ as a signal
+    """
+    faq_score, _ = entry.faq_index.best_match(question)
+    return llm_service.route(question, faq_score)
+
+async def build_fallback_answer(entry: CachedProduct, question: str, language: str) -> str:
+    """
+    Extractive answer from the product's FAQs and description, used when the LLM is unavailable
+    """
+    extract = extractive_answer(entry.context, entry.faq_index, question)
+    notice, text = await asyncio.gather(
+        llm_service.translate_text_async(FALLBACK_NOTICE, 'en', language),
+        llm_service.translate_text_async(extract["text"], extract["language"] or entry.language, language)
+    )
+    return f"{notice}\n\n{text}"
+
+async def cache_streamed_answer(entry: CachedProduct, question: str, language: str, answer: str,
+                                llm_latency_ms: float) -> None:
+    """
+    Cache an answer streamed by /chat/stream once the stream has ended
+    Streamed tokens reach the client unchecked, but /chat serves cached answers as being in
+    the requested language, so the cached copy gets the same language check as generate()
+    """
+    answer = await llm_service.ensure_language(answer, language)
+    answer_cache.set(entry.product_id, entry.version, question, language, answer, llm_latency_ms)
+    # Embedding is CPU work, kept off the event loop
+    await asyncio.to_thread(semantic_cache.add, entry.product_id, entry.version, question, language, answer)
 
 @app.get("/product/{product_id}", response_model=ProductResponse)
 async def get_product(product_id: int, db: Session = Depends(get_db)):
     """
     Get all relevant information for a given product ID
     """
-    product = db.query(Product).filter(Product.id == product_id).first()
+    entry = get_product_entry(db, product_id)
 
-    if not product:
+    if not entry:
         raise HTTPException(status_code=404, detail="Product not found")
 
-    return product
+    # Scan counts decide which products are primed on the next startup
+    scan_counter.record(product_id)
+
+    # Serve the pre-serialized ProductResponse to skip validation and encoding per request
+    return Response(content=entry.response_json, media_type="application/json")
 
 @app.post("/chat", response_model=ChatResponse)
-async def chat(request: ChatRequest, db: Session = Depends(get_db)):
+async def chat(request: ChatRequest, background_tasks: BackgroundTasks, response: Response,
+               db: Session = Depends(get_db),
+               accept_language: Optional[str] = Header(None)):
     """
     Process chat request with product context and return LLM response
     """
-    # Fetch product data
-    product = db.query(Product).filter(Product.id == request.product_id).first()
+    started = time.perf_counter()
+    trace = start_trace("/chat")
+
+    with span("language"):
+        detected_language = await llm_service.resolve_language_async(request.user_message, request.language,
+                                                                     accept_language)
+
+    # Fetch product data (prebuilt context dict from the product cache,
+    # pre-translated into the user's language when available)
+    with span("product"):
+        entry = get_product_entry(db, request.product_id, detected_language)
 
-    if not product:
+    if not entry:
         raise HTTPException(status_code=404, detail="Product not found")
 
-    # Convert product data to dict for prompt creation
-    product_data = {
-        "name": product.name,
-        "category": product.category,
-        "manufacturer": product.manufacturer,
-        "model_number": product.model_number,
-        "price": product.price,
-        "short_description": product.short_description,
-        "detailed_specs": product.detailed_specs,
-        "warranty_info": product.warranty_info,
-        "faqs": [
-            {
-                "question": faq.question,
-                "answer": faq.answer,
-                "category": faq.category
-            }
-            for faq in product.faqs
-        ]
-    }
+    product_data = entry.context
 
-    # Create context-rich prompt with language support
-    prompt, detected_language = llm_service.create_context_prompt(
-        product_data,
-        request.user_message,
-        response_language=request.language
-    )
+    with span("quick_answer"):
+        answer, source = await find_answer_without_llm(entry, request.user_message, detected_language)
+
+    coalesced = False
+    tier = None
+    if answer is None:
+        source = "llm"
+        tier = route_question(entry, request.user_message)
+
+        async def ask_llm():
+            # Create context-rich prompt with language support
+            with span("prompt"):
+                prompt, _ = llm_service.create_context_prompt(
+                    product_data,
+                    request.user_message,
+                    response_language=detected_language,
+                    faqs=entry.relevant_faqs(request.user_message)
+                )
 
-    # Get LLM response in the detected/requested language
-    answer = await llm_service.get_response(prompt, detected_language)
+            # Get LLM response in the detected/requested language
+            with span("llm"):
+                return await llm_service.generate(prompt, detected_language, tier=tier)
+
+        flight_key = answer_cache.key(entry.product_id, entry.version, request.user_message, detected_language)
+        result, coalesced = await llm_flights.do(flight_key, ask_llm)
+        answer = result.answer
+
+        if result.ok:
+            # Only the request that made the call caches its answer
+            if not coalesced:
+                answer_cache.set(entry.product_id, entry.version, request.user_message,
+                                 detected_language, answer, result.latency_ms)
+                # Index the question for paraphrase matching after the response is sent
+                background_tasks.add_task(semantic_cache.add, entry.product_id, entry.version,
+                                          request.user_message, detected_language, answer)
+        elif EXTRACTIVE_FALLBACK:
+            with span("fallback"):
+                answer = await build_fallback_answer(entry, request.user_message, detected_language)
+            source = "fallback"
+
+    latency_ms = (time.perf_counter() - started) * 1000
+    answer_latency.record(source, latency_ms)
+
+    if trace is not None:
+        if SERVER_TIMING_HEADER:
+            response.headers["Server-Timing"] = trace.server_timing()
+        finish_trace(trace, product_id=request.product_id, language=detected_language, source=source,
+                     coalesced=coalesced, tier=tier.name if tier is not None else None)
 
     return ChatResponse(
         answer=answer,
-        product_name=product.name,
-        detected_language=detected_language
+        product_name=product_data["name"],
+        detected_language=detected_language,
+        source=source,
+        latency_ms=round(latency_ms, 2)
+    )
+
+@app.post("/chat/stream")
+async def chat_stream(request: ChatRequest, background_tasks: BackgroundTasks,
+                      db: Session = Depends(get_db),
+                      accept_language: Optional[str] = Header(None)):
+    """
+    Stream the chat answer as Server-Sent Events
+
+    Events: "meta" (product_name, detected_language), "token" (text delta),
+    "error" (apology text if the LLM call failed) and a final "done" with usage stats,
+    answer source and latency
+    """
+    started = time.perf_counter()
+    trace = start_trace("/chat/stream")
+
+    with span("language"):
+        detected_language = await llm_service.resolve_language_async(request.user_message, request.language,
+                                                                     accept_language)
+
+    with span("product"):
+        entry = get_product_entry(db, request.product_id, detected_language)
+
+    if not entry:
+        raise HTTPException(status_code=404, detail="Product not found")
+
+    product_data = entry.context
+    with span("quick_answer"):
+        quick_answer, quick_source = await find_answer_without_llm(entry, request.user_message, detected_language)
+
+    if quick_answer is None:
+        # Reject with 503 before the stream starts when the LLM queue is already full
+        llm_service.limiter.check()
+
+    # Headers go out before the LLM runs, so Server-Timing only covers the stages above;
+    # the full breakdown (time to first token, stream) is in the log line
+    headers = {
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no"  # Disable proxy buffering so tokens reach the client immediately
+    }
+    if trace is not None and SERVER_TIMING_HEADER:
+        headers["Server-Timing"] = trace.server_timing()
+
+    async def event_stream():
+        yield sse_event("meta", {
+            "product_name": product_data["name"],
+            "detected_language": detected_language
+        })
+
+        if quick_answer is not None:
+            yield sse_event("token", {"text": quick_answer})
+            latency_ms = (time.perf_counter() - started) * 1000
+            answer_latency.record(quick_source, latency_ms)
+            finish_trace(trace, product_id=request.product_id, language=detected_language, source=quick_source)
+            yield sse_event("done", {"usage": None, "source": quick_source, "latency_ms": round(latency_ms, 2)})
+            return
+
+        with span("prompt"):
+            prompt, _ = llm_service.create_context_prompt(
+                product_data,
+                request.user_message,
+                response_language=detected_language,
+                faqs=entry.relevant_faqs(request.user_message)
+            )
+
+        tier = route_question(entry, request.user_message)
+        llm_started = time.perf_counter()
+        chunks = []
+        failed = False
+        source = "llm"
+        async for event in llm_service.stream_response(prompt, detected_language, tier=tier):
+            if event["type"] == "done":
+                latency_ms = (time.perf_counter() - started) * 1000
+                answer_latency.record(source, latency_ms)
+                if trace is not None:
+                    trace.add("llm_stream", (time.perf_counter() - llm_started) * 1000)
+                    finish_trace(trace, product_id=request.product_id, language=detected_language, source=source,
+                                 tier=tier.name)
+                yield sse_event("done", {"usage": event["usage"], "source": source, "latency_ms": round(latency_ms, 2)})
+                if not failed:
+                    # Cached after the stream ends, with the language check generate() applies
+                    background_tasks.add_task(cache_streamed_answer, entry, request.user_message, detected_language,
+                                              "".join(chunks).strip(), (time.perf_counter() - llm_started) * 1000)
+            else:
+                if event["type"] == "error":
+                    failed = True
+                    if EXTRACTIVE_FALLBACK and not chunks and "status_code" not in event:
+                        # Nothing streamed yet, so the fallback can replace the apology
+                        source = "fallback"
+                        answer = await build_fallback_answer(entry, request.user_message, detected_language)
+                        yield sse_event("token", {"text": answer})
+                        continue
+                else:
+                    if not chunks and trace is not None:
+                        trace.add("llm_first_token", (time.perf_counter() - llm_started) * 1000)
+                    chunks.append(event["text"])
+                # Overload errors also carry status_code and retry_after
+                yield sse_event(event["type"], {key: value for key, value in event.items() if key != "type"})
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers=headers,
+        background=background_tasks
     )
 
 @app.get("/health")
 async def health_check():
-    """Health check endpoint"""
+    """Liveness probe: answers as long as the process is serving requests, checks nothing else"""
     return {"status": "healthy"}
 
+@app.get("/ready")
+async def readiness_check():
+    """
+    Readiness probe: warm-up status, DB pool saturation, LLM circuit state and event-loop lag
+    Returns 503 when the worker should be taken out of rotation
+    """
+    checks = {
+        "warmup": warmup_state.as_dict(),
+        "db_pool": db_pool_stats(engine),
+        "llm_circuit": llm_service.providers.circuit_stats(),
+        "event_loop_lag": loop_lag_monitor.stats()
+    }
+    ready, reasons = check_readiness(**checks)
+    content = {"status": "ready" if ready else "not_ready", "reasons": reasons, **checks}
+    return JSONResponse(status_code=200 if ready else 503, content=content)
+
+@app.get("/metrics")
+async def metrics():
+    """Prometheus metrics"""
+    return Response(content=render_metrics(), media_type=CONTENT_TYPE_LATEST)
+
+@app.get("/chat/stats")
+async def chat_stats():
+    """
+    Answer latency per source, NLP pool and LLM queue depth, coalesced and hedged LLM
+    calls, model tiers, LLM provider health and language detection counters
+    """
+    return {
+        "answer_latency": answer_latency.summary(),
+        "nlp_pool": nlp_pool.stats(),
+        "llm_limiter": llm_service.limiter.stats(),
+        "llm_coalescing": llm_flights.stats(),
+        "llm_hedging": llm_service.hedge_stats(),
+        "llm_routing": llm_service.routing_stats(),
+        "llm_providers": llm_service.providers.stats(),
+        "language_detection": llm_service.language_detector.stats()
+    }
+
+@app.get("/cache/stats")
+async def cache_stats():
+    """Hit/miss counters and occupancy for the in-process caches"""
+    return {
+        "product_cache": product_cache.stats(),
+        "answer_cache": answer_cache.stats(),
+        "semantic_cache": semantic_cache.stats(),
+        "translation_cache": translation_cache.stats()
+    }
+
@@ -0,0 +1,136 @@
+import time
+from typing import Any, Callable, Dict, Iterable
+from prometheus_client import Counter, Gauge, Histogram, REGISTRY, CONTENT_TYPE_LATEST, generate_latest
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+# Latency buckets (seconds) shared by the request and LLM histograms
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# Sub-millisecond buckets for in-process steps
+FAST_BUCKETS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5)
+
+HTTP_REQUESTS = Counter(
+    "chatbot_http_requests_total", "HTTP requests by route and status",
+    ["method", "endpoint", "status"]
+)
+HTTP_LATENCY = Histogram(
+    "chatbot_http_request_duration_seconds", "Time until the response body is fully sent",
+    ["endpoint"], buckets=LATENCY_BUCKETS
+)
+LLM_LATENCY = Histogram(
+    "chatbot_llm_request_duration_seconds", "LLM API call duration",
+    ["mode", "outcome", "tier"], buckets=LATENCY_BUCKETS
+)
+LLM_PROVIDER_LATENCY = Histogram(
+    "chatbot_llm_provider_call_duration_seconds", "Single LLM provider call duration (per attempt)",
+    ["provider", "outcome"], buckets=LATENCY_BUCKETS
+)
+LLM_IN_FLIGHT = Gauge("chatbot_llm_in_flight", "LLM calls holding a concurrency slot")
+LLM_QUEUE_DEPTH = Gauge("chatbot_llm_queue_depth", "Requests waiting for an LLM concurrency slot")
+LLM_QUEUE_WAIT = Histogram(
+    "chatbot_llm_queue_wait_seconds", "Time spent waiting for an LLM concurrency slot",
+    buckets=FAST_BUCKETS + (1.0, 2.5, 5.0, 10.0)
+)
+LLM_REJECTED = Counter(
+    "chatbot_llm_rejected_total", "Requests or retries turned away before reaching the LLM",
+    ["reason"]
+)
+LLM_HEDGES = Counter(
+    "chatbot_llm_hedges_total", "Hedged LLM requests: fired, won (hedge answered first), skipped (no budget or slot)",
+    ["outcome"]
+)
+LLM_RETRIES = Counter("chatbot_llm_retries_total", "LLM call retries after transient errors")
+COALESCED_REQUESTS = Counter(
+    "chatbot_coalesced_requests_total", "Requests that joined an identical in-flight call",
+    ["flight"]
+)
+LLM_TOKENS = Counter(
+    "chatbot_llm_tokens_total", "Tokens reported by the LLM API",
+    ["type", "tier"]
+)
+TRANSLATION_CALLS = Counter(
+    "chatbot_translation_calls_total", "Translation backend calls (cache hits excluded)",
+    ["backend", "outcome"]
+)
+LANGUAGE_DETECTION_LATENCY = Histogram(
+    "chatbot_language_detection_duration_seconds", "Language detection time including NLP pool wait",
+    ["path"], buckets=FAST_BUCKETS
+)
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "chatbot_db_pool_checkout_wait_seconds", "Time to get a connection from the DB pool",
+    buckets=FAST_BUCKETS + (1.0, 5.0, 30.0)
+)
+
+
+def record_llm_usage(usage: Dict[str, Any], tier: str = "standard") -> None:
+    """Add prompt/completion token counts from an LLM usage dict, per model tier"""
+    if not usage:
+        return
+    for key in ("prompt_tokens", "completion_tokens"):
+        if usage.get(key):
+            LLM_TOKENS.labels(key.split("_")[0], tier).inc(usage[key])
+
+
+class StatsCollector:
+    """
+    Exposes the stats() dicts of the in-process caches at scrape time, so cache
+    lookups pay nothing extra for metrics
+    """
+
+    def __init__(self, sources: Dict[str, Callable[[], Dict[str, Any]]]):
+        self.sources = sources
+
+    def collect(self) -> Iterable:
+        hits = CounterMetricFamily("chatbot_cache_hits", "Cache hits", labels=["cache"])
+        misses = CounterMetricFamily("chatbot_cache_misses", "Cache misses", labels=["cache"])
+        ratio = GaugeMetricFamily("chatbot_cache_hit_ratio", "Cache hit ratio since start", labels=["cache"])
+        entries = GaugeMetricFamily("chatbot_cache_entries", "Entries held by the cache", labels=["cache"])
+        for name, stats_fn in self.sources.items():
+            stats = stats_fn()
+            hits.add_metric([name], stats.get("hits", 0))
+            misses.add_metric([name], stats.get("misses", 0))
+            ratio.add_metric([name], stats.get("hit_ratio", 0.0))
+            if "entries" in stats:
+                entries.add_metric([name], stats["entries"])
+        return [hits, misses, ratio, entries]
+
+
+def register_cache_stats(sources: Dict[str, Callable[[], Dict[str, Any]]]) -> None:
+    REGISTRY.register(StatsCollector(sources))
+
+
+def render_metrics() -> bytes:
+    return generate_latest(REGISTRY)
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware counting requests and timing them per route template
+    (/product/{product_id}, not /product/42) to keep label cardinality bounded
+    Streaming responses are timed until the last chunk is sent
+    """
+
+    def __init__(self, app, skip_paths: Iterable[str] = ("/metrics",)):
+        self.app = app
+        self.skip_paths = set(skip_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.skip_paths:
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            endpoint = getattr(route, "path", "unmatched")
+            HTTP_REQUESTS.labels(scope["method"], endpoint, str(status)).inc()
+            HTTP_LATENCY.labels(endpoint).observe(time.perf_counter() - started)
@@ -0,0 +1,104 @@
+"""
+Lightweight versioned schema migrations
+
+Base.metadata.create_all only creates missing tables, so changes to existing
+tables (new indexes, columns) are applied here. Each migration runs once and is
+recorded in the schema_migrations table. Migrations must be idempotent so that
+a fresh database, where create_all already built the final schema, can record
+them as applied without error.
+"""
+import logging
+from datetime import datetime
+from typing import Callable, List, Tuple
+from sqlalchemy import Column, Integer, String, DateTime, MetaData, Table, inspect, text
+from sqlalchemy.engine import Connection, Engine
+
+from models import FAQ, ProductTranslation
+
+logger = logging.getLogger(__name__)
+
+migration_metadata = MetaData()
+
+schema_migrations = Table(
+    "schema_migrations",
+    migration_metadata,
+    Column("version", Integer, primary_key=True),
+    Column("description", String(255), nullable=False),
+    Column("applied_at", DateTime, default=datetime.utcnow),
+)
+
+# Arbitrary key for pg_advisory_xact_lock so concurrent workers don't race on startup
+MIGRATION_LOCK_ID = 815_320_001
+
+
+def _create_index(index) -> Callable[[Connection], None]:
+    def upgrade(conn: Connection) -> None:
+        index.create(conn, checkfirst=True)
+    return upgrade
+
+
+def _create_table(table) -> Callable[[Connection], None]:
+    def upgrade(conn: Connection) -> None:
+        table.create(conn, checkfirst=True)
+    return upgrade
+
+
+def _add_column(table, name: str) -> Callable[[Connection], None]:
+    def upgrade(conn: Connection) -> None:
+        if name in {column["name"] for column in inspect(conn).get_columns(table.name)}:
+            return
+        column = table.c[name]
+        conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column.type.compile(conn.dialect)}"))
+    return upgrade
+
+
+def _index(table, name: str):
+    return next(index for index in table.indexes if index.name == name)
+
+
+# (version, description, upgrade) - append only, never reorder or edit applied entries
+MIGRATIONS: List[Tuple[int, str, Callable[[Connection], None]]] = [
+    (1, "Add composite index on faqs(product_id, category)",
+     _create_index(_index(FAQ.__table__, "ix_faqs_product_id_category"))),
+    (2, "Add product_translations table",
+     _create_table(ProductTranslation.__table__)),
+    (3, "Add product_translations.backend",
+     _add_column(ProductTranslation.__table__, "backend")),
+]
+
+
+def run_migrations(engine: Engine) -> List[int]:
+    """
+    Apply all pending migrations in order
+    Returns the list of versions applied by this call
+    """
+    applied_now = []
+
+    with engine.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            conn.execute(text("SELECT pg_advisory_xact_lock(:id)"), {"id": MIGRATION_LOCK_ID})
+
+        migration_metadata.create_all(conn)
+        applied = {row[0] for row in conn.execute(schema_migrations.select().with_only_columns(schema_migrations.c.version))}
+
+        for version, description, upgrade in MIGRATIONS:
+            if version in applied:
+                continue
+            upgrade(conn)
+            conn.execute(schema_migrations.insert().values(
+                version=version,
+                description=description,
+                applied_at=datetime.utcnow()
+            ))
+            applied_now.append(version)
+            logger.info("Applied migration %s: %s", version, description)
+
+    return applied_now
+
+
+if __name__ == "__main__":
+    from database import engine
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    versions = run_migrations(engine)
+    print(f"Applied {len(versions)} migration(s)" if versions else "Database schema is up to date")
@@ -0,0 +1,135 @@
+import os
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Tuple
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+# Scripts written without spaces between words (Thai, kana, CJK ideographs): \w+ sees a
+# whole clause as one word there, so their length is counted in characters instead
+_UNSPACED = re.compile(r"[\u0e00-\u0e7f\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]")
+CHARS_PER_WORD_UNSPACED = 2
+
+# Wording that signals comparison, reasoning or multi-step answers
+COMPLEX_KEYWORDS = {
+    "compare", "comparison", "difference", "differences", "versus", "vs",
+    "recommend", "recommendation", "explain", "why", "troubleshoot", "troubleshooting",
+    "steps", "step", "setup", "configure", "install", "alternative", "alternatives",
+    "pros", "cons", "tradeoff",
+}
+# The same intent in unspaced scripts, matched as substrings
+COMPLEX_PHRASES = ("比較", "比较", "違い", "区别", "區別", "相比", "説明して", "解释", "解釋", "为什么", "為什麼", "なぜ")
+# Only complex together with another signal: "Should I charge it overnight?" is a simple question
+WEAK_COMPLEX_KEYWORDS = {"better", "best", "should", "suitable"}
+COMPARISON_WORDS = {"than", "or"}
+
+# Single-fact lookups that a short answer covers
+SIMPLE_KEYWORDS = {
+    "price", "cost", "costs", "warranty", "weight", "weigh", "color", "colour", "colors",
+    "size", "dimensions", "battery", "model", "manufacturer", "brand", "stock", "available",
+}
+
+
+@dataclass(frozen=True)
+class ModelTier:
+    """
+    Model and generation settings for one class of question
+    """
+    name: str
+    model: str
+    max_tokens: int
+    temperature: float
+
+
+def load_tier(name: str, model: str, max_tokens: int, temperature: float) -> ModelTier:
+    """Tier defaults overridden by LLM_TIER_<NAME>_MODEL / _MAX_TOKENS / _TEMPERATURE"""
+    prefix = f"LLM_TIER_{name.upper()}_"
+    return ModelTier(
+        name=name,
+        model=os.getenv(prefix + "MODEL", model),
+        max_tokens=int(os.getenv(prefix + "MAX_TOKENS", str(max_tokens))),
+        temperature=float(os.getenv(prefix + "TEMPERATURE", str(temperature)))
+    )
+
+
+class ModelRouter:
+    """
+    Picks a model tier per question from cheap signals: length, intent keywords and
+    how closely the question matches a stored FAQ
+
+    simple   - short single-fact questions, or ones an FAQ nearly answers
+    standard - everything else (the original llama-3.1-8b-instant / 500 tokens setup)
+    complex  - comparisons, explanations, troubleshooting, multi-part or long questions
+    """
+
+    def __init__(self, simple: ModelTier, standard: ModelTier, complex: ModelTier,
+                 enabled: bool = True, simple_max_words: int = 6, complex_min_words: int = 25,
+                 faq_score_simple: float = 0.6):
+        self.tiers = {tier.name: tier for tier in (simple, standard, complex)}
+        self.default = standard
+        self.enabled = enabled
+        self.simple_max_words = simple_max_words
+        self.complex_min_words = complex_min_words
+        self.faq_score_simple = faq_score_simple
+        self.routed: Dict[str, int] = {name: 0 for name in self.tiers}
+
+    def classify(self, question: str, faq_score: float = 0.0) -> Tuple[str, str]:
+        """
+        Return (tier name, reason)
+        """
+        text = question.casefold()
+        words = _WORD.findall(text)
+        keywords = set(words)
+        unspaced = len(_UNSPACED.findall(text))
+        if unspaced:
+            # Approximate word count: spaced words plus unspaced characters per word
+            length = len(_WORD.findall(_UNSPACED.sub(" ", text))) + unspaced / CHARS_PER_WORD_UNSPACED
+        else:
+            length = len(words)
+
+        if keywords & COMPLEX_KEYWORDS or any(phrase in text for phrase in COMPLEX_PHRASES):
+            return "complex", "keyword"
+        if keywords & WEAK_COMPLEX_KEYWORDS and (keywords & COMPARISON_WORDS
+                                                 or length > self.simple_max_words * 2):
+            return "complex", "keyword"
+        if question.count("?") + question.count("？") >= 2:
+            return "complex", "multi_part"
+        if length >= self.complex_min_words:
+            return "complex", "length"
+        if faq_score >= self.faq_score_simple:
+            return "simple", "faq_match"
+        # One- or two-word questions ("price?") only count as lookups in spaced scripts
+        if length <= self.simple_max_words and (keywords & SIMPLE_KEYWORDS or (not unspaced and length <= 2)):
+            return "simple", "short_lookup"
+        return "standard", "default"
+
+    def route(self, question: str, faq_score: float = 0.0) -> ModelTier:
+        if not self.enabled:
+            return self.default
+        name, _ = self.classify(question, faq_score)
+        self.routed[name] += 1
+        return self.tiers[name]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "routed": dict(self.routed),
+            "tiers": {
+                name: {"model": tier.model, "max_tokens": tier.max_tokens, "temperature": tier.temperature}
+                for name, tier in self.tiers.items()
+            },
+        }
+
+
+def load_router() -> ModelRouter:
+    """Router configured from the environment (LLM_ROUTING, LLM_TIER_*)"""
+    return ModelRouter(
+        simple=load_tier("simple", "llama-3.1-8b-instant", 200, 0.2),
+        standard=load_tier("standard", "llama-3.1-8b-instant", 500, 0.3),
+        complex=load_tier("complex", "llama-3.3-70b-versatile", 800, 0.3),
+        enabled=os.getenv("LLM_ROUTING", "true").lower() == "true",
+        faq_score_simple=float(os.getenv("LLM_ROUTING_FAQ_SCORE_SIMPLE", "0.6"))
+    )
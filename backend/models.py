@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -30,6 +30,11 @@ class FAQ(Base):
     FAQ model for product-specific questions and answers
     """
     __tablename__ = "faqs"
+    __table_args__ = (
+        # Leading product_id column also serves plain "FAQs for product X" lookups,
+        # so no separate single-column index is needed
+        Index("ix_faqs_product_id_category", "product_id", "category"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     product_id = Column(Integer, ForeignKey("products.id"))
@@ -39,4 +44,32 @@ class FAQ(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
 
     # Relationship to product
-    product = relationship("Product", back_populates="faqs")
\ No newline at end of file
+    product = relationship("Product", back_populates="faqs")
+
+class ProductTranslation(Base):
+    """
+    Pre-translated product and FAQ text, produced offline by pretranslate.py
+
+    source_hash is the hash of the English source text at translation time; rows
+    whose hash no longer matches the current source are stale and ignored. backend is
+    the translator that produced the text; rows from stand-in backends (identity, local)
+    and rows written before the column existed are never served.
+    """
+    __tablename__ = "product_translations"
+    __table_args__ = (
+        UniqueConstraint("entity_type", "entity_id", "field", "language",
+                         name="uq_product_translations_entity_field_language"),
+        # All translations for one product in one language are loaded together
+        Index("ix_product_translations_product_id_language", "product_id", "language"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    product_id = Column(Integer, ForeignKey("products.id"), nullable=False)
+    entity_type = Column(String(20), nullable=False)  # "product" or "faq"
+    entity_id = Column(Integer, nullable=False)  # products.id or faqs.id
+    field = Column(String(50), nullable=False)  # e.g. "short_description", "answer"
+    language = Column(String(10), nullable=False)  # ISO 639-1 code as in LLMService.language_map
+    source_hash = Column(String(64), nullable=False)
+    text = Column(Text, nullable=False)
+    backend = Column(String(20))  # TRANSLATOR_BACKEND name, e.g. "google"
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
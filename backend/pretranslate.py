@@ -0,0 +1,144 @@
+"""
+Pre-translate product descriptions, warranty text and FAQs into every supported language
+
+Results go to the product_translations table, which the chat endpoints use to
+build prompts directly in the user's language. Each (product, language) pair is
+committed on its own, so an interrupted run resumes where it stopped, and only
+text whose English source changed since the last run (or that another backend
+translated) is translated again. Rows are tagged with TRANSLATOR_BACKEND; output of
+the identity and local stand-ins is stored for load tests but never served.
+
+Usage:
+    python pretranslate.py
+    python pretranslate.py --workers 8 --languages es fr de --product-ids 1 2
+    python pretranslate.py --dry-run
+"""
+import argparse
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy.orm import joinedload
+
+from database import SessionLocal, create_tables
+from models import Product, ProductTranslation
+from product_cache import build_product_data
+from llm_service import LLMService
+from translations import translation_units, source_hash
+from translators import STAND_IN_BACKENDS
+
+llm_service = LLMService()
+
+
+def load_contexts(product_ids: Optional[List[int]] = None) -> Dict[int, Dict[str, Any]]:
+    db = SessionLocal()
+    try:
+        query = db.query(Product).options(joinedload(Product.faqs))
+        if product_ids:
+            query = query.filter(Product.id.in_(product_ids))
+        return {product.id: build_product_data(product) for product in query.all()}
+    finally:
+        db.close()
+
+
+def translate_product(product_id: int, context: Dict[str, Any], language: str,
+                      dry_run: bool = False) -> Tuple[int, int]:
+    """
+    Bring one product's translations for one language up to date
+    Returns (translated, failed) unit counts
+    """
+    backend = llm_service.translator.name
+    db = SessionLocal()
+    try:
+        existing = {
+            (row.entity_type, row.entity_id, row.field): row
+            for row in db.query(ProductTranslation).filter(
+                ProductTranslation.product_id == product_id,
+                ProductTranslation.language == language
+            )
+        }
+
+        pending = [
+            (key, text) for key, text in translation_units(product_id, context)
+            if key not in existing or existing[key].source_hash != source_hash(text)
+            or existing[key].backend != backend
+        ]
+        if dry_run or not pending:
+            return len(pending), 0
+
+        # One batched backend call per (product, language) instead of one per string
+        try:
+            results = llm_service.translate_batch([text for _, text in pending], 'en', language, strict=True)
+        except Exception as e:
+            print(f"  product {product_id} [{language}] failed: {e}")
+            return 0, len(pending)
+
+        for ((entity_type, entity_id, field), text), result in zip(pending, results):
+            row = existing.get((entity_type, entity_id, field))
+            if row is None:
+                db.add(ProductTranslation(
+                    product_id=product_id,
+                    entity_type=entity_type,
+                    entity_id=entity_id,
+                    field=field,
+                    language=language,
+                    source_hash=source_hash(text),
+                    text=result,
+                    backend=backend
+                ))
+            else:
+                row.source_hash = source_hash(text)
+                row.text = result
+                row.backend = backend
+
+        db.commit()
+        return len(pending), 0
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=4, help="concurrent (product, language) jobs")
+    parser.add_argument("--languages", nargs="+", help="language codes (default: all supported except English)")
+    parser.add_argument("--product-ids", type=int, nargs="+", help="only these products")
+    parser.add_argument("--dry-run", action="store_true", help="report pending work without translating")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    create_tables()
+
+    if llm_service.translator.name in STAND_IN_BACKENDS:
+        print(f"TRANSLATOR_BACKEND={llm_service.translator.name} is a stand-in: its output is stored "
+              f"but never served as a translation")
+
+    languages = args.languages or [code for code in llm_service.language_map if code != 'en']
+    contexts = load_contexts(args.product_ids)
+    print(f"Pre-translating {len(contexts)} product(s) into {len(languages)} language(s) "
+          f"with {args.workers} worker(s)")
+
+    total_translated = total_failed = 0
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        futures = {
+            pool.submit(translate_product, product_id, context, language, args.dry_run): (product_id, language)
+            for product_id, context in contexts.items()
+            for language in languages
+        }
+        for future in as_completed(futures):
+            product_id, language = futures[future]
+            try:
+                translated, failed = future.result()
+            except Exception as e:
+                print(f"product {product_id} [{language}]: {e}")
+                continue
+            total_translated += translated
+            total_failed += failed
+            if translated or failed:
+                action = "pending" if args.dry_run else "translated"
+                print(f"product {product_id} [{language}]: {translated} {action}, {failed} failed")
+
+    action = "Pending" if args.dry_run else "Translated"
+    print(f"{action}: {total_translated} text(s), failed: {total_failed}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+import hashlib
+import json
+import logging
+import os
+import sys
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional
+from sqlalchemy.orm import Session, joinedload
+from dotenv import load_dotenv
+
+from cache import TTLCache, cache_max_bytes, deep_sizeof
+from embeddings import get_embedder
+from faq_retrieval import FAQIndex
+from lexical_guard import lexically_compatible
+from translations import load_translations, localize_context
+from models import Product
+from schemas import ProductResponse
+
+# Load environment variables
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Per-entry overhead of the CachedProduct, FAQIndex and cache bookkeeping objects
+ENTRY_OVERHEAD_BYTES = 2048
+
+# Number of FAQs included in each prompt
+FAQ_TOP_K = int(os.getenv("FAQ_TOP_K", "5"))
+
+# Minimum question similarity for answering straight from a stored FAQ
+FAQ_MATCH_THRESHOLD = float(os.getenv("FAQ_MATCH_THRESHOLD", "0.85"))
+
+
+@dataclass
+class CachedProduct:
+    """
+    Prebuilt, immutable view of a product shared by the chat and product endpoints
+    """
+    product_id: int
+    context: Dict[str, Any]   # Product dict used to build LLM prompts
+    response_json: bytes      # Serialized ProductResponse
+    version: str              # Content hash, changes whenever product data or FAQs change
+    size: int                 # Approximate memory footprint in bytes
+    faq_index: FAQIndex       # BM25 index over context["faqs"]
+    language: str = "en"      # Language of the context text (pre-translated entries differ from "en")
+
+    def relevant_faqs(self, question: str, k: int = FAQ_TOP_K) -> List[Dict[str, Any]]:
+        """The k FAQs most relevant to question, for prompt building"""
+        return self.faq_index.top_k(question, k)
+
+    def match_faq(self, question: str,
+                  threshold: float = FAQ_MATCH_THRESHOLD) -> Optional[Dict[str, Any]]:
+        """
+        The stored FAQ whose question matches with at least threshold confidence, if any
+        Near misses ("USB-A" against an FAQ about "USB-C") are rejected by the lexical guard
+        """
+        score, faq = self.faq_index.best_match(question)
+        if faq is None or score < threshold or not lexically_compatible(question, faq.get("question", "")):
+            return None
+        return faq
+
+
+def build_product_data(product: Product) -> Dict[str, Any]:
+    """
+    Convert product data to dict for prompt creation
+    """
+    return {
+        "name": product.name,
+        "category": product.category,
+        "manufacturer": product.manufacturer,
+        "model_number": product.model_number,
+        "price": product.price,
+        "short_description": product.short_description,
+        "detailed_specs": product.detailed_specs,
+        "warranty_info": product.warranty_info,
+        "faqs": [
+            {
+                "id": faq.id,
+                "question": faq.question,
+                "answer": faq.answer,
+                "category": faq.category
+            }
+            for faq in product.faqs
+        ]
+    }
+
+
+def build_cached_product(product: Product) -> CachedProduct:
+    """
+    Build the cache entry for a product loaded from the database
+    """
+    context = build_product_data(product)
+    response_json = ProductResponse.model_validate(product).model_dump_json().encode("utf-8")
+    return _build_entry(product.id, context, response_json)
+
+
+def _build_entry(product_id: int, context: Dict[str, Any], response_json: bytes,
+                 language: str = "en") -> CachedProduct:
+    version = hashlib.sha1(
+        json.dumps(context, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    ).hexdigest()[:16]
+
+    faq_index = FAQIndex(context["faqs"], embedder=get_embedder())
+
+    # Measured object by object: Python strings and dicts take several times their JSON length
+    size = deep_sizeof(context) + sys.getsizeof(response_json) + faq_index.nbytes() + ENTRY_OVERHEAD_BYTES
+
+    return CachedProduct(
+        product_id=product_id,
+        context=context,
+        response_json=response_json,
+        version=version,
+        size=size,
+        faq_index=faq_index,
+        language=language
+    )
+
+
+# Memory cap is this cache's share of CACHE_MEMORY_MB (PRODUCT_CACHE_MAX_MB overrides it)
+product_cache = TTLCache(
+    max_entries=int(os.getenv("PRODUCT_CACHE_MAX_ENTRIES", "5000")),
+    ttl_seconds=float(os.getenv("PRODUCT_CACHE_TTL_SECONDS", "300")),
+    max_bytes=cache_max_bytes("product"),
+    sizeof=lambda entry: getattr(entry, "size", 64)
+)
+
+# Cached under (product_id, language) when a product has no usable translations
+_NOT_TRANSLATED = object()
+
+
+class ScanCounter:
+    """
+    Counts product page loads (QR scans) so warm-up can prime the most-scanned products
+
+    Counts are kept in memory and saved to a small JSON file on shutdown; the
+    number of tracked products is bounded by keeping only the most scanned.
+    """
+
+    def __init__(self, path: Optional[str], max_products: int = 10000):
+        self.path = path
+        self.max_products = max_products
+        self._counts: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, product_id: int) -> None:
+        with self._lock:
+            self._counts[product_id] += 1
+            if len(self._counts) > 2 * self.max_products:
+                self._counts = Counter(dict(self._counts.most_common(self.max_products)))
+
+    def top(self, n: int) -> List[int]:
+        with self._lock:
+            return [product_id for product_id, _ in self._counts.most_common(n)]
+
+    def load(self) -> None:
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path) as f:
+                saved = {int(k): int(v) for k, v in json.load(f).items()}
+        except (OSError, ValueError) as e:
+            logger.warning("Could not load scan counts from %s: %s", self.path, e)
+            return
+        with self._lock:
+            self._counts.update(saved)
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        with self._lock:
+            snapshot = dict(self._counts.most_common(self.max_products))
+        try:
+            with open(self.path, "w") as f:
+                json.dump(snapshot, f)
+        except OSError as e:
+            logger.warning("Could not save scan counts to %s: %s", self.path, e)
+
+
+scan_counter = ScanCounter(os.getenv("PRODUCT_SCAN_COUNTS_PATH", "product_scan_counts.json") or None)
+
+
+def load_product(db: Session, product_id: int) -> Optional[Product]:
+    """
+    Load a product together with its FAQs in a single query
+    joinedload avoids the second SELECT the lazy Product.faqs relationship would issue
+    """
+    return (
+        db.query(Product)
+        .options(joinedload(Product.faqs))
+        .filter(Product.id == product_id)
+        .first()
+    )
+
+
+def get_product_entry(db: Session, product_id: int,
+                      language: Optional[str] = None) -> Optional[CachedProduct]:
+    """
+    Return the cached product, loading it from the database on a miss
+    When language is given and pre-translations exist, the entry's context is in
+    that language; otherwise the English entry is returned.
+    Returns None if the product does not exist
+    """
+    entry = product_cache.get(product_id)
+    if entry is None:
+        product = load_product(db, product_id)
+        if not product:
+            return None
+
+        entry = build_cached_product(product)
+        product_cache.set(product_id, entry)
+
+    if not language or language == entry.language:
+        return entry
+
+    localized = product_cache.get((product_id, language))
+    if localized is None:
+        context = localize_context(product_id, entry.context, load_translations(db, product_id, language))
+        if context is None:
+            localized = _NOT_TRANSLATED
+        else:
+            localized = _build_entry(product_id, context, entry.response_json, language)
+        product_cache.set((product_id, language), localized)
+
+    return entry if localized is _NOT_TRANSLATED else localized
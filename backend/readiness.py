@@ -0,0 +1,100 @@
+import asyncio
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from dotenv import load_dotenv
+
+from latency import LatencyWindow
+
+# Load environment variables
+load_dotenv()
+
+# Thresholds above which /ready asks the orchestrator to take the worker out of rotation
+READY_MAX_DB_POOL_SATURATION = float(os.getenv("READY_MAX_DB_POOL_SATURATION", "0.9"))
+READY_MAX_LOOP_LAG_MS = float(os.getenv("READY_MAX_LOOP_LAG_MS", "500"))
+# An open LLM circuit affects every worker alike, and FAQ/cache answers still work,
+# so by default it is reported but does not fail readiness
+READY_FAIL_ON_LLM_CIRCUIT_OPEN = os.getenv("READY_FAIL_ON_LLM_CIRCUIT_OPEN", "false").lower() == "true"
+
+
+class LoopLagMonitor:
+    """
+    Measures event-loop lag: how late a periodic sleep wakes up
+
+    A blocked loop (sync DB or CPU work on the loop thread) shows up here long
+    before requests start timing out.
+    """
+
+    def __init__(self, interval: float = 0.5, window: int = 60):
+        self.interval = interval
+        self.lag = LatencyWindow(window)
+        self.last_lag_ms = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            self.last_lag_ms = max(0.0, (time.perf_counter() - expected) * 1000)
+            self.lag.record(self.last_lag_ms)
+
+    def stats(self) -> Dict[str, Any]:
+        summary = self.lag.summary()
+        return {
+            "last_ms": round(self.last_lag_ms, 2),
+            "p95_ms": summary["p95_ms"],
+            "max_threshold_ms": READY_MAX_LOOP_LAG_MS,
+        }
+
+
+loop_lag_monitor = LoopLagMonitor(interval=float(os.getenv("LOOP_LAG_INTERVAL_SECONDS", "0.5")))
+
+
+def db_pool_stats(engine) -> Dict[str, Any]:
+    """
+    Checked-out connections vs. capacity (pool_size + max_overflow) of a QueuePool
+    Pools without those limits (e.g. SQLite memory databases) report saturation 0
+    """
+    pool = engine.pool
+    try:
+        size = pool.size()
+        checked_out = pool.checkedout()
+        capacity = size + max(0, pool._max_overflow)
+    except AttributeError:
+        return {"pool": type(pool).__name__, "saturation": 0.0}
+    return {
+        "pool": type(pool).__name__,
+        "size": size,
+        "checked_out": checked_out,
+        "overflow": pool.overflow(),
+        "capacity": capacity,
+        "saturation": round(checked_out / capacity, 3) if capacity else 0.0,
+        "max_saturation": READY_MAX_DB_POOL_SATURATION,
+    }
+
+
+def check_readiness(warmup: Dict[str, Any], db_pool: Dict[str, Any], llm_circuit: Dict[str, Any],
+                    event_loop_lag: Dict[str, Any]) -> Tuple[bool, List[str]]:
+    """
+    Decide whether the worker should receive traffic
+    Returns (ready, reasons it is not)
+    """
+    reasons = []
+    if warmup["status"] != "complete":
+        reasons.append("warm-up not complete")
+    if db_pool["saturation"] >= READY_MAX_DB_POOL_SATURATION:
+        reasons.append(f"DB pool {db_pool['saturation']:.0%} checked out")
+    if READY_FAIL_ON_LLM_CIRCUIT_OPEN and llm_circuit["state"] == "open":
+        reasons.append("LLM circuit open")
+    if event_loop_lag["p95_ms"] > READY_MAX_LOOP_LAG_MS:
+        reasons.append(f"event loop lag p95 {event_loop_lag['p95_ms']:.0f} ms")
+    return not reasons, reasons
@@ -0,0 +1,58 @@
+import random
+import threading
+import time
+from typing import Any, Dict
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """
+    Exponential backoff with full jitter: uniform(0, min(cap, base * 2^attempt))
+    Jitter spreads retries from many requests so they do not hit the API in lockstep
+    """
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+class RetryBudget:
+    """
+    Limits retries to a fraction of recent traffic so retries cannot multiply load
+    during an outage (also used to cap the rate of hedged requests)
+
+    Every call deposits `ratio` tokens and every retry spends one; a small floor of
+    min_per_second keeps retries possible at low traffic.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_per_second: float = 1.0, max_tokens: float = 10.0):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._refilled_at = time.monotonic()
+        self._lock = threading.Lock()
+        self.spent = 0
+        self.exhausted = 0
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Spend one token; False when the budget is exhausted"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.max_tokens, self._tokens + (now - self._refilled_at) * self.min_per_second)
+            self._refilled_at = now
+            if self._tokens < 1:
+                self.exhausted += 1
+                return False
+            self._tokens -= 1
+            self.spent += 1
+            return True
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "tokens": round(self._tokens, 2),
+                "ratio": self.ratio,
+                "spent": self.spent,
+                "exhausted": self.exhausted,
+            }
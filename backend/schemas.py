@@ -33,4 +33,6 @@ class ChatRequest(BaseModel):
 class ChatResponse(BaseModel):
     answer: str
     product_name: str
-    detected_language: Optional[str] = None  # Language the response is in
\ No newline at end of file
+    detected_language: Optional[str] = None  # Language the response is in
+    source: Optional[str] = None  # Where the answer came from: "faq", "cache", "semantic_cache", "llm" or "fallback"
+    latency_ms: Optional[float] = None  # Server-side time to produce the answer
\ No newline at end of file
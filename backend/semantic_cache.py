@@ -0,0 +1,158 @@
+import os
+import sys
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+from dotenv import load_dotenv
+
+from cache import TTLCache, cache_max_bytes
+from embeddings import Embedder, get_embedder
+from lexical_guard import lexically_compatible
+
+# Load environment variables
+load_dotenv()
+
+
+class _ProductIndex:
+    """
+    In-memory NumPy index of past questions and answers for one
+    (product, version, language); oldest rows are dropped once full
+    """
+
+    # Candidates above the threshold checked by the lexical guard per lookup
+    max_candidates = 3
+
+    def __init__(self, dimension: int, capacity: int):
+        self.capacity = capacity
+        # Start small and grow on demand; most products only see a handful of distinct questions
+        self.vectors = np.zeros((min(8, capacity), dimension), dtype=np.float32)
+        self.questions: List[str] = []
+        self.answers: List[str] = []
+        self.text_bytes = 0
+        self.count = 0
+        self.next_row = 0
+        self.lock = threading.Lock()
+
+    def search(self, vector: np.ndarray, threshold: float) -> List[Tuple[float, str, str]]:
+        """(similarity, question, answer) of the closest rows at or above threshold, best first"""
+        with self.lock:
+            if self.count == 0:
+                return []
+            # Rows are L2-normalized, so the dot product is the cosine similarity
+            scores = self.vectors[:self.count] @ vector
+            best = np.argsort(-scores)[:self.max_candidates]
+            return [(float(scores[row]), self.questions[row], self.answers[row])
+                    for row in best if scores[row] >= threshold]
+
+    def add(self, vector: np.ndarray, question: str, answer: str) -> None:
+        with self.lock:
+            row = self.next_row
+            if row >= len(self.vectors):
+                grown = np.zeros((min(2 * len(self.vectors), self.capacity), self.vectors.shape[1]), dtype=np.float32)
+                grown[:len(self.vectors)] = self.vectors
+                self.vectors = grown
+            self.vectors[row] = vector
+            self.text_bytes += sys.getsizeof(question) + sys.getsizeof(answer)
+            if row < len(self.answers):
+                self.text_bytes -= sys.getsizeof(self.questions[row]) + sys.getsizeof(self.answers[row])
+                self.questions[row] = question
+                self.answers[row] = answer
+            else:
+                self.questions.append(question)
+                self.answers.append(answer)
+            self.next_row = (row + 1) % self.capacity
+            self.count = min(self.count + 1, self.capacity)
+
+    def nbytes(self) -> int:
+        """Vectors plus stored question and answer strings"""
+        return sys.getsizeof(self.vectors) + self.text_bytes + 16 * len(self.answers) + 512
+
+
+class SemanticCache:
+    """
+    Embedding-based answer cache that matches paraphrased questions
+
+    Each (product id, product version, language) gets its own index; a lookup
+    returns the stored answer of the most similar past question when the cosine
+    similarity reaches the threshold and the lexical guard finds no difference in
+    negation, numbers or content words between the two questions.
+    """
+
+    def __init__(self, embedder: Embedder, threshold: float = 0.8,
+                 per_product_capacity: int = 64, max_products: int = 500,
+                 ttl_seconds: float = 3600.0, max_bytes: Optional[int] = None):
+        self.embedder = embedder
+        self.threshold = threshold
+        self.per_product_capacity = per_product_capacity
+        # Indexes grow as questions are added, so each add re-measures its index
+        self._indexes = TTLCache(max_entries=max_products, ttl_seconds=ttl_seconds, max_bytes=max_bytes,
+                                 sizeof=lambda index: index.nbytes())
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.guard_rejections = 0
+        self._hit_similarity_total = 0.0
+
+    def lookup(self, product_id: int, version: str, question: str, language: str) -> Optional[str]:
+        """
+        Return the answer to the closest past question, or None below the threshold
+        """
+        index = self._indexes.get((product_id, version, language))
+        candidates = index.search(self.embedder.embed_one(question), self.threshold) if index is not None else []
+        match = next(((score, answer) for score, past_question, answer in candidates
+                      if lexically_compatible(question, past_question)), None)
+
+        with self._lock:
+            if match is not None:
+                self.hits += 1
+                self._hit_similarity_total += match[0]
+                return match[1]
+            if candidates:
+                self.guard_rejections += 1
+            self.misses += 1
+            return None
+
+    def add(self, product_id: int, version: str, question: str, language: str, answer: str) -> None:
+        """
+        Remember an LLM answer for future paraphrases of question
+        """
+        key = (product_id, version, language)
+        vector = self.embedder.embed_one(question)
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is None:
+                index = _ProductIndex(self.embedder.dimension, self.per_product_capacity)
+                self._indexes.set(key, index)
+        index.add(vector, question, answer)
+        self._indexes.resize(key)
+
+    def clear(self) -> None:
+        self._indexes.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        indexes = self._indexes.stats()
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "products": indexes["entries"],
+                "bytes": indexes["bytes"],
+                "max_bytes": indexes["max_bytes"],
+                "threshold": self.threshold,
+                "hits": self.hits,
+                "misses": self.misses,
+                "guard_rejections": self.guard_rejections,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "avg_hit_similarity": round(self._hit_similarity_total / self.hits, 4) if self.hits else 0.0,
+            }
+
+
+semantic_cache = SemanticCache(
+    # Same embedder as FAQ matching, so one EMBEDDER setting covers both
+    embedder=get_embedder(),
+    threshold=float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.8")),
+    per_product_capacity=int(os.getenv("SEMANTIC_CACHE_PER_PRODUCT", "64")),
+    max_products=int(os.getenv("SEMANTIC_CACHE_MAX_PRODUCTS", "500")),
+    ttl_seconds=float(os.getenv("SEMANTIC_CACHE_TTL_SECONDS", "3600")),
+    # Vectors and answers together stay within this cache's share of CACHE_MEMORY_MB
+    max_bytes=cache_max_bytes("semantic")
+)
@@ -0,0 +1,16 @@
+import os
+import sys
+import tempfile
+
+# Backend modules import each other as top-level modules and read their configuration
+# at import time, so the environment is set up before any of them is imported
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+_tmp_dir = tempfile.mkdtemp(prefix="chatbot-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_tmp_dir, 'test.db')}"
+os.environ["TRANSLATION_CACHE_PATH"] = ""
+os.environ["PRODUCT_SCAN_COUNTS_PATH"] = ""
+os.environ["TRANSLATOR_BACKEND"] = "identity"
+os.environ["LLM_PROVIDERS"] = "mock"
+os.environ["GROQ_API_KEY"] = ""
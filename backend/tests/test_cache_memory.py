@@ -0,0 +1,27 @@
+"""
+Caches stay within their byte caps, including the semantic cache whose indexes grow in place
+"""
+from cache import TTLCache
+from embeddings import HashingEmbedder
+from semantic_cache import SemanticCache
+
+
+def test_resize_evicts_when_a_value_grows():
+    cache = TTLCache(max_bytes=100, sizeof=len)
+    cache.set("a", [0] * 40)
+    cache.set("b", [0] * 40)
+    cache.get("a")
+    cache.get("b").extend([0] * 30)
+    cache.resize("b")
+    assert cache.get("a") is None
+    assert cache.stats()["bytes"] == 70
+
+
+def test_semantic_cache_respects_max_bytes():
+    max_bytes = 64 * 1024
+    cache = SemanticCache(HashingEmbedder(), max_bytes=max_bytes)
+    for i in range(400):
+        cache.add(i % 20, "v1", f"question number {i}", "en", "answer " * 50)
+    stats = cache.stats()
+    assert 0 < stats["bytes"] <= max_bytes
+    assert stats["products"] < 20
@@ -0,0 +1,41 @@
+"""
+Questions that closely match a stored FAQ are answered from it; near misses that differ
+in a model code, number or negation go to the LLM instead
+"""
+import pytest
+
+from product_cache import _build_entry
+
+FAQS = [
+    {"id": 1, "question": "Does it have USB-C?", "answer": "Yes, two USB-C ports.", "category": "ports"},
+    {"id": 2, "question": "Is it waterproof?", "answer": "Yes, it is rated IP68.", "category": "durability"},
+    {"id": 3, "question": "Does it support 4K output?", "answer": "Yes, over HDMI.", "category": "display"},
+    {"id": 4, "question": "What is the battery life?", "answer": "About 10 hours.", "category": "battery"},
+]
+
+
+@pytest.fixture(scope="module")
+def entry():
+    context = {"name": "FAQ Match Laptop", "faqs": FAQS}
+    return _build_entry(1, context, b"{}")
+
+
+@pytest.mark.parametrize("question, faq_id", [
+    ("Does it have USB-C", 1),
+    ("is it waterproof?", 2),
+    ("Battery life?", 4),
+])
+def test_matching_question_uses_faq(entry, question, faq_id):
+    faq = entry.match_faq(question)
+    assert faq is not None and faq["id"] == faq_id
+
+
+@pytest.mark.parametrize("question", [
+    "Does it have USB-A?",
+    "Is it not waterproof?",
+    "Does it support 8K output?",
+])
+def test_near_miss_goes_to_llm(entry, question):
+    # Close enough to the FAQ that the embedding alone would match at a lower threshold
+    assert entry.faq_index.best_match(question)[0] >= 0.6
+    assert entry.match_faq(question) is None
@@ -0,0 +1,86 @@
+"""
+Each request that misses the product cache loads the product and its FAQs in exactly
+one SELECT (joinedload instead of the lazy Product.faqs relationship)
+"""
+from contextlib import contextmanager
+from typing import Iterator, List
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from database import SessionLocal, create_tables, engine
+from models import FAQ, Product
+from product_cache import product_cache
+from answer_cache import answer_cache
+import main
+
+
+@contextmanager
+def count_selects() -> Iterator[List[str]]:
+    statements: List[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture(scope="module")
+def product_id() -> int:
+    create_tables()
+    db = SessionLocal()
+    try:
+        product = Product(name="Query Count Laptop", short_description="Test product",
+                          detailed_specs="16GB RAM", warranty_info="1 year", category="Laptops",
+                          price="$999.00", manufacturer="TestCorp", model_number="QC-1")
+        product.faqs = [
+            FAQ(question="What is the battery life?", answer="About 10 hours.", category="battery"),
+            FAQ(question="Does it have a warranty?", answer="One year.", category="warranty"),
+            FAQ(question="How much does it weigh?", answer="1.4 kg.", category="weight"),
+        ]
+        db.add(product)
+        db.commit()
+        return product.id
+    finally:
+        db.close()
+
+
+@pytest.fixture
+def client() -> TestClient:
+    # Not used as a context manager: startup warm-up would prime the product cache
+    product_cache.clear()
+    answer_cache.clear()
+    return TestClient(main.app)
+
+
+def test_product_cache_miss_is_one_select(client, product_id):
+    with count_selects() as statements:
+        response = client.get(f"/product/{product_id}")
+    assert response.status_code == 200
+    assert len(response.json()["faqs"]) == 3
+    assert len(statements) == 1, statements
+
+    # Served from the product cache afterwards
+    with count_selects() as statements:
+        assert client.get(f"/product/{product_id}").status_code == 200
+    assert statements == []
+
+
+def test_chat_cache_miss_is_one_select(client, product_id):
+    with count_selects() as statements:
+        response = client.post("/chat", json={"product_id": product_id, "user_message": "Is it good for gaming?",
+                                              "language": "en"})
+    assert response.status_code == 200
+    assert len(statements) == 1, statements
+
+
+def test_unknown_product_is_one_select(client):
+    with count_selects() as statements:
+        assert client.get("/product/999999").status_code == 404
+    assert len(statements) == 1, statements
@@ -0,0 +1,60 @@
+"""
+Paraphrases of a cached question hit the semantic cache; questions that embed close to it
+but ask something else (negated, other numbers or model codes, other content words) miss
+"""
+import pytest
+
+from embeddings import HashingEmbedder
+from semantic_cache import SemanticCache
+
+PRODUCT_ID = 1
+VERSION = "v1"
+
+SAME_QUESTION = [
+    ("What is the battery life?", "battery life?"),
+    ("How much does it weigh?", "how much does it weigh"),
+    ("Does it come with a charger?", "does it come with charger"),
+    ("Is it waterproof?", "Is it waterproof"),
+    ("Is the battery replaceable?", "Are the batteries replaceable?"),
+]
+
+DIFFERENT_QUESTION = [
+    ("Is it waterproof?", "Is it not waterproof?"),
+    ("Does it have USB-C?", "Does it have USB-A?"),
+    ("How many USB ports?", "How many USB-C ports?"),
+    ("Does it support 4K?", "Does it support 8K?"),
+    ("Does it have a warranty?", "Does it have an extended warranty?"),
+]
+
+
+@pytest.fixture
+def cache() -> SemanticCache:
+    # The low threshold lets every pair reach the lexical guard
+    return SemanticCache(HashingEmbedder(), threshold=0.5)
+
+
+@pytest.mark.parametrize("cached, asked", SAME_QUESTION)
+def test_rewording_hits(cache, cached, asked):
+    cache.add(PRODUCT_ID, VERSION, cached, "en", "answer")
+    assert cache.lookup(PRODUCT_ID, VERSION, asked, "en") == "answer"
+
+
+@pytest.mark.parametrize("cached, asked", DIFFERENT_QUESTION)
+def test_different_question_misses(cache, cached, asked):
+    cache.add(PRODUCT_ID, VERSION, cached, "en", "answer")
+    assert cache.lookup(PRODUCT_ID, VERSION, asked, "en") is None
+    assert cache.lookup(PRODUCT_ID, VERSION, cached, "en") == "answer"
+
+
+def test_negation_misses_at_default_threshold():
+    # Similarity 0.816 with the hashing embedder, above the 0.8 default
+    cache = SemanticCache(HashingEmbedder())
+    cache.add(PRODUCT_ID, VERSION, "Is it waterproof?", "en", "Yes, it is rated IP68.")
+    assert cache.lookup(PRODUCT_ID, VERSION, "Is it not waterproof?", "en") is None
+    assert cache.stats()["guard_rejections"] == 1
+
+
+def test_compatible_candidate_behind_a_rejected_one(cache):
+    cache.add(PRODUCT_ID, VERSION, "Is it not waterproof?", "en", "negated")
+    cache.add(PRODUCT_ID, VERSION, "Is it waterproof", "en", "plain")
+    assert cache.lookup(PRODUCT_ID, VERSION, "Is it waterproof?", "en") == "plain"
@@ -0,0 +1,48 @@
+"""
+The SQLite level of the translation cache is bounded by row count and age
+"""
+import sqlite3
+
+from translation_cache import TranslationCache
+
+
+def disk_rows(path) -> int:
+    with sqlite3.connect(path) as conn:
+        return conn.execute("SELECT COUNT(*) FROM translation_cache").fetchone()[0]
+
+
+def test_oldest_rows_beyond_the_cap_are_pruned(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = TranslationCache(path, disk_max_rows=10, prune_every=5)
+    for i in range(23):
+        cache.set(f"text {i}", "en", "es", f"texto {i}")
+    assert disk_rows(path) <= 10 + 5
+    cache.close()
+
+    # A fresh process prunes on open and still finds the newest rows on disk
+    cache = TranslationCache(path, disk_max_rows=10)
+    assert disk_rows(path) == 10
+    assert cache.get("text 22", "en", "es") == "texto 22"
+    assert cache.get("text 0", "en", "es") is None
+
+
+def test_expired_rows_are_not_served(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = TranslationCache(path, disk_ttl_seconds=0.0)
+    cache.set("hello", "en", "es", "hola")
+    cache.close()
+    assert TranslationCache(path, disk_ttl_seconds=0.0).get("hello", "en", "es") is None
+
+
+def test_files_without_created_at_are_upgraded(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE translation_cache (backend TEXT NOT NULL, source TEXT NOT NULL, "
+                     "target TEXT NOT NULL, text_hash TEXT NOT NULL, translated TEXT NOT NULL, "
+                     "PRIMARY KEY (backend, source, target, text_hash))")
+        conn.execute("INSERT INTO translation_cache VALUES ('google', 'en', 'es', 'x', 'old')")
+    cache = TranslationCache(path)
+    assert cache.stats()["disk_enabled"]
+    assert disk_rows(path) == 0
+    cache.set("hello", "en", "es", "hola")
+    assert disk_rows(path) == 1
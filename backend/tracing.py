@@ -0,0 +1,96 @@
+import logging
+import os
+import random
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Fraction of requests that get a per-stage breakdown (0 disables tracing)
+TRACE_SAMPLE_RATE = float(os.getenv("TRACE_SAMPLE_RATE", "1.0"))
+# Return the breakdown to the client as a Server-Timing header on sampled requests
+SERVER_TIMING_HEADER = os.getenv("SERVER_TIMING_HEADER", "false").lower() == "true"
+
+
+class RequestTrace:
+    """
+    Per-stage timings of one request
+    Stages that run more than once (e.g. two translations) are summed
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.started = time.perf_counter()
+        self.spans: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+
+    def add(self, stage: str, duration_ms: float) -> None:
+        self.spans[stage] = self.spans.get(stage, 0.0) + duration_ms
+        self.counts[stage] = self.counts.get(stage, 0) + 1
+
+    @property
+    def total_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+    def server_timing(self) -> str:
+        """Server-Timing header value, e.g. "product;dur=1.2, llm;dur=812.4, total;dur=815.0" """
+        parts = [f"{stage};dur={duration:.1f}" for stage, duration in self.spans.items()]
+        parts.append(f"total;dur={self.total_ms:.1f}")
+        return ", ".join(parts)
+
+    def as_dict(self, **fields: Any) -> Dict[str, Any]:
+        return {
+            "event": "request_trace",
+            "endpoint": self.name,
+            "total_ms": round(self.total_ms, 2),
+            "spans_ms": {stage: round(duration, 2) for stage, duration in self.spans.items()},
+            **{f"{stage}_calls": count for stage, count in self.counts.items() if count > 1},
+            **fields,
+        }
+
+
+_current_trace: ContextVar[Optional[RequestTrace]] = ContextVar("current_trace", default=None)
+
+
+class span:
+    """
+    Time a block as one stage of the current request's trace
+    A no-op (one context variable lookup) when the request is not sampled
+    """
+
+    __slots__ = ("stage", "trace", "started")
+
+    def __init__(self, stage: str):
+        self.stage = stage
+
+    def __enter__(self):
+        self.trace = _current_trace.get()
+        if self.trace is not None:
+            self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        if self.trace is not None:
+            self.trace.add(self.stage, (time.perf_counter() - self.started) * 1000)
+        return False
+
+
+def start_trace(name: str) -> Optional[RequestTrace]:
+    """Start tracing the current request if it is sampled; returns None otherwise"""
+    if TRACE_SAMPLE_RATE <= 0 or (TRACE_SAMPLE_RATE < 1 and random.random() >= TRACE_SAMPLE_RATE):
+        return None
+    trace = RequestTrace(name)
+    _current_trace.set(trace)
+    return trace
+
+
+def finish_trace(trace: Optional[RequestTrace], **fields: Any) -> None:
+    """Log the request's breakdown as one structured log line"""
+    if trace is None:
+        return
+    logger.info("request_trace", extra=trace.as_dict(**fields))
@@ -0,0 +1,167 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+from typing import Any, Dict, Optional
+from dotenv import load_dotenv
+
+from cache import TTLCache, cache_max_bytes
+
+# Load environment variables
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+
+class TranslationCache:
+    """
+    Two-level translation cache: in-memory LRU in front of an on-disk SQLite store
+
+    Keys are (backend, source, target, sha256(text)), so stand-in backends never
+    serve their output as real translations. Memory hits cost microseconds; disk
+    hits survive restarts and are promoted back into memory.
+
+    The disk level is bounded: rows older than disk_ttl_seconds are ignored, and every
+    prune_every writes expired rows are deleted and the oldest rows beyond
+    disk_max_rows are dropped.
+    """
+
+    def __init__(self, path: Optional[str], max_entries: int = 20000,
+                 ttl_seconds: float = 86400.0, max_bytes: Optional[int] = None,
+                 disk_max_rows: int = 50000, disk_ttl_seconds: float = 30 * 86400.0,
+                 prune_every: int = 500):
+        self._memory = TTLCache(
+            max_entries=max_entries,
+            ttl_seconds=ttl_seconds,
+            max_bytes=max_bytes,
+            # The translation plus its key (tuple, sha256 hex digest) and LRU slot
+            sizeof=lambda text: sys.getsizeof(text) + 512
+        )
+        self._lock = threading.Lock()
+        self._conn = None
+        self.disk_max_rows = disk_max_rows
+        self.disk_ttl_seconds = disk_ttl_seconds
+        self.prune_every = prune_every
+        self._writes_since_prune = 0
+        self.disk_hits = 0
+        self.disk_misses = 0
+        self.disk_pruned = 0
+
+        if path:
+            try:
+                self._conn = sqlite3.connect(path, check_same_thread=False)
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("PRAGMA synchronous=NORMAL")
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS translation_cache ("
+                    "backend TEXT NOT NULL, source TEXT NOT NULL, target TEXT NOT NULL, "
+                    "text_hash TEXT NOT NULL, translated TEXT NOT NULL, "
+                    "created_at REAL NOT NULL DEFAULT 0, "
+                    "PRIMARY KEY (backend, source, target, text_hash))"
+                )
+                columns = {row[1] for row in self._conn.execute("PRAGMA table_info(translation_cache)")}
+                if "created_at" not in columns:
+                    # Files from before the disk level was bounded: their rows count as expired
+                    self._conn.execute("ALTER TABLE translation_cache ADD COLUMN created_at REAL NOT NULL DEFAULT 0")
+                self._conn.execute(
+                    "CREATE INDEX IF NOT EXISTS ix_translation_cache_created_at ON translation_cache (created_at)"
+                )
+                self._conn.commit()
+                self._prune()
+            except sqlite3.Error as e:
+                logger.warning("Translation disk cache disabled: %s", e)
+                self._conn = None
+
+    @staticmethod
+    def key(text: str, source: str, target: str, backend: str):
+        return (backend, source, target, hashlib.sha256(text.encode("utf-8")).hexdigest())
+
+    def get_memory(self, text: str, source: str, target: str, backend: str = "google") -> Optional[str]:
+        """Memory level only: never touches SQLite, so it is safe to call on the event loop"""
+        return self._memory.get(self.key(text, source, target, backend))
+
+    def get(self, text: str, source: str, target: str, backend: str = "google") -> Optional[str]:
+        """Return the cached translation, or None on a miss in both levels"""
+        key = self.key(text, source, target, backend)
+        translated = self._memory.get(key)
+        if translated is not None or self._conn is None:
+            return translated
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT translated FROM translation_cache "
+                "WHERE backend = ? AND source = ? AND target = ? AND text_hash = ? AND created_at >= ?",
+                key + (time.time() - self.disk_ttl_seconds,)
+            ).fetchone()
+            if row is None:
+                self.disk_misses += 1
+                return None
+            self.disk_hits += 1
+
+        self._memory.set(key, row[0])
+        return row[0]
+
+    def set(self, text: str, source: str, target: str, translated: str,
+            backend: str = "google") -> None:
+        key = self.key(text, source, target, backend)
+        self._memory.set(key, translated)
+        if self._conn is None:
+            return
+
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO translation_cache "
+                    "(backend, source, target, text_hash, translated, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                    key + (translated, time.time())
+                )
+                self._conn.commit()
+                self._writes_since_prune += 1
+                if self._writes_since_prune >= self.prune_every:
+                    self._prune()
+            except sqlite3.Error as e:
+                logger.warning("Translation disk cache write failed: %s", e)
+
+    def _prune(self) -> None:
+        """Delete expired rows and the oldest rows beyond disk_max_rows (caller holds the lock)"""
+        self._writes_since_prune = 0
+        deleted = self._conn.execute(
+            "DELETE FROM translation_cache WHERE created_at < ?", (time.time() - self.disk_ttl_seconds,)
+        ).rowcount
+        excess = self._conn.execute("SELECT COUNT(*) FROM translation_cache").fetchone()[0] - self.disk_max_rows
+        if excess > 0:
+            deleted += self._conn.execute(
+                "DELETE FROM translation_cache WHERE rowid IN "
+                "(SELECT rowid FROM translation_cache ORDER BY created_at LIMIT ?)", (excess,)
+            ).rowcount
+        self._conn.commit()
+        self.disk_pruned += deleted
+
+    def close(self) -> None:
+        if self._conn is not None:
+            with self._lock:
+                self._conn.close()
+                self._conn = None
+
+    def stats(self) -> Dict[str, Any]:
+        stats = self._memory.stats()
+        stats.update({
+            "disk_enabled": self._conn is not None,
+            "disk_hits": self.disk_hits,
+            "disk_misses": self.disk_misses,
+            "disk_pruned": self.disk_pruned,
+        })
+        return stats
+
+
+translation_cache = TranslationCache(
+    path=os.getenv("TRANSLATION_CACHE_PATH", "translation_cache.sqlite3") or None,
+    max_entries=int(os.getenv("TRANSLATION_CACHE_MAX_ENTRIES", "20000")),
+    ttl_seconds=float(os.getenv("TRANSLATION_CACHE_TTL_SECONDS", "86400")),
+    max_bytes=cache_max_bytes("translation"),
+    disk_max_rows=int(os.getenv("TRANSLATION_CACHE_DISK_MAX_ROWS", "50000")),
+    disk_ttl_seconds=float(os.getenv("TRANSLATION_CACHE_DISK_TTL_DAYS", "30")) * 86400
+)
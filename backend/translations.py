@@ -0,0 +1,87 @@
+import hashlib
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy.orm import Session
+
+from models import ProductTranslation
+from translators import STAND_IN_BACKENDS
+
+# Fields of the prompt context that are pre-translated
+PRODUCT_FIELDS = ("short_description", "warranty_info")
+FAQ_FIELDS = ("question", "answer")
+
+# (entity_type, entity_id, field)
+UnitKey = Tuple[str, int, str]
+
+
+def source_hash(text: str) -> str:
+    """Hash of the English source text a translation was made from"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:32]
+
+
+def translation_units(product_id: int, context: Dict[str, Any]) -> List[Tuple[UnitKey, str]]:
+    """
+    List every translatable piece of text in a product context as (key, source text)
+    """
+    units = [
+        (("product", product_id, field), context[field])
+        for field in PRODUCT_FIELDS
+        if context.get(field)
+    ]
+    for faq in context.get("faqs", []):
+        units.extend(
+            (("faq", faq["id"], field), faq[field])
+            for field in FAQ_FIELDS
+            if faq.get(field)
+        )
+    return units
+
+
+def load_translations(db: Session, product_id: int, language: str) -> Dict[UnitKey, Tuple[str, str]]:
+    """
+    Load all stored translations of a product in one language made by a real translator
+    (not identity or local, and not rows from before the backend was recorded)
+    Returns {(entity_type, entity_id, field): (source_hash, text)}
+    """
+    rows = (
+        db.query(ProductTranslation)
+        .filter(ProductTranslation.product_id == product_id,
+                ProductTranslation.language == language,
+                ProductTranslation.backend.isnot(None),
+                ProductTranslation.backend.notin_(STAND_IN_BACKENDS))
+        .all()
+    )
+    return {(row.entity_type, row.entity_id, row.field): (row.source_hash, row.text) for row in rows}
+
+
+def localize_context(product_id: int, context: Dict[str, Any],
+                     translations: Dict[UnitKey, Tuple[str, str]]) -> Optional[Dict[str, Any]]:
+    """
+    Return a copy of context with every up-to-date translation applied
+    Stale translations (source text changed since) keep the English text; such
+    FAQs are marked with "language": "en". Returns None if nothing could be applied.
+    """
+    applied = 0
+
+    def pick(key: UnitKey, original: Optional[str]) -> Optional[str]:
+        nonlocal applied
+        stored = translations.get(key)
+        if original and stored and stored[0] == source_hash(original):
+            applied += 1
+            return stored[1]
+        return original
+
+    localized = dict(context)
+    for field in PRODUCT_FIELDS:
+        localized[field] = pick(("product", product_id, field), context.get(field))
+
+    localized["faqs"] = []
+    for faq in context.get("faqs", []):
+        before = applied
+        localized_faq = dict(faq, **{field: pick(("faq", faq["id"], field), faq.get(field)) for field in FAQ_FIELDS})
+        if applied - before < len(FAQ_FIELDS):
+            # Partly stale FAQs stay entirely in English so question and answer agree
+            localized_faq = dict(faq, language="en")
+            applied = before
+        localized["faqs"].append(localized_faq)
+
+    return localized if applied else None
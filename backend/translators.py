@@ -0,0 +1,141 @@
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+from dotenv import load_dotenv
+from deep_translator import GoogleTranslator
+
+# Load environment variables
+load_dotenv()
+
+
+class Translator:
+    """
+    Interface for translation backends
+    translate and translate_batch raise on failure; callers decide how to fall back
+    """
+
+    name = "base"
+
+    def translate(self, text: str, source_lang: str, target_lang: str) -> str:
+        raise NotImplementedError
+
+    def translate_batch(self, texts: List[str], source_lang: str, target_lang: str) -> List[str]:
+        """Translate many strings; the default makes one call per string"""
+        return [self.translate(text, source_lang, target_lang) for text in texts]
+
+
+class GoogleTranslatorBackend(Translator):
+    """
+    Google Translate via deep_translator, with one reusable translator per language pair
+    and thread
+
+    GoogleTranslator keeps the text of the current call on the instance, so one
+    instance must never be used by two threads at once (asyncio.to_thread callers,
+    the pretranslate worker pool); each thread gets its own.
+
+    Batches of single-line strings are packed one per line into as few requests as
+    the per-request size limit allows; if a response does not split back into the
+    same number of lines, that chunk is retried one string at a time.
+    """
+
+    name = "google"
+    MAX_REQUEST_CHARS = 4500
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def _get(self, source_lang: str, target_lang: str) -> GoogleTranslator:
+        translators: Optional[Dict[Tuple[str, str], GoogleTranslator]] = getattr(self._local, "translators", None)
+        if translators is None:
+            translators = self._local.translators = {}
+        key = (source_lang, target_lang)
+        translator = translators.get(key)
+        if translator is None:
+            # GoogleTranslator uses 'auto' for automatic detection
+            src = 'auto' if source_lang == 'auto' else source_lang
+            translator = translators[key] = GoogleTranslator(source=src, target=target_lang)
+        return translator
+
+    def translate(self, text: str, source_lang: str, target_lang: str) -> str:
+        return self._get(source_lang, target_lang).translate(text)
+
+    def translate_batch(self, texts: List[str], source_lang: str, target_lang: str) -> List[str]:
+        translator = self._get(source_lang, target_lang)
+        if any("\n" in text for text in texts):
+            return [translator.translate(text) for text in texts]
+
+        results: List[str] = []
+        for chunk in self._chunks(texts):
+            if len(chunk) == 1:
+                results.append(translator.translate(chunk[0]))
+                continue
+            lines = [line.strip() for line in translator.translate("\n".join(chunk)).split("\n") if line.strip()]
+            if len(lines) == len(chunk):
+                results.extend(lines)
+            else:
+                results.extend(translator.translate(text) for text in chunk)
+        return results
+
+    def _chunks(self, texts: List[str]) -> List[List[str]]:
+        chunks: List[List[str]] = []
+        size = 0
+        for text in texts:
+            if not chunks or size + len(text) + 1 > self.MAX_REQUEST_CHARS:
+                chunks.append([])
+                size = 0
+            chunks[-1].append(text)
+            size += len(text) + 1
+        return chunks
+
+
+class IdentityTranslator(Translator):
+    """No-op backend: returns text unchanged (offline runs, English-only deployments)"""
+
+    name = "identity"
+
+    def translate(self, text: str, source_lang: str, target_lang: str) -> str:
+        return text
+
+    def translate_batch(self, texts: List[str], source_lang: str, target_lang: str) -> List[str]:
+        return list(texts)
+
+
+class LocalTranslator(Translator):
+    """
+    Deterministic local stand-in for load tests
+    Returns "[target] text" after a configurable delay per call (not per string),
+    mimicking the round-trip cost of a remote service.
+    """
+
+    name = "local"
+
+    def __init__(self, latency_ms: float = 50.0):
+        self.latency_ms = latency_ms
+
+    def translate(self, text: str, source_lang: str, target_lang: str) -> str:
+        return self.translate_batch([text], source_lang, target_lang)[0]
+
+    def translate_batch(self, texts: List[str], source_lang: str, target_lang: str) -> List[str]:
+        if self.latency_ms > 0:
+            time.sleep(self.latency_ms / 1000)
+        return [f"[{target_lang}] {text}" for text in texts]
+
+
+# Backends whose output is not a translation; pretranslate.py stores their rows but they are never served
+STAND_IN_BACKENDS = (IdentityTranslator.name, LocalTranslator.name)
+
+
+def load_translator(name: Optional[str] = None) -> Translator:
+    """
+    Build the translator backend selected by name or TRANSLATOR_BACKEND
+    (google, identity or local)
+    """
+    name = (name or os.getenv("TRANSLATOR_BACKEND", "google")).lower()
+    if name == "google":
+        return GoogleTranslatorBackend()
+    if name == "identity":
+        return IdentityTranslator()
+    if name == "local":
+        return LocalTranslator(latency_ms=float(os.getenv("LOCAL_TRANSLATOR_LATENCY_MS", "50")))
+    raise ValueError(f"Unknown TRANSLATOR_BACKEND: {name}")
@@ -0,0 +1,115 @@
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional
+from dotenv import load_dotenv
+from langdetect import detect
+from sqlalchemy import text
+
+from database import engine, SessionLocal
+from models import Product
+from product_cache import get_product_entry, scan_counter
+
+# Load environment variables
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+
+class WarmupState:
+    """
+    Progress of the startup warm-up; the worker reports ready only once it is complete
+    """
+
+    def __init__(self):
+        self.status = "pending"  # pending -> running -> complete
+        self.steps: Dict[str, Dict[str, Any]] = {}
+        self.started_at: Optional[float] = None
+        self.completed_at: Optional[float] = None
+
+    @property
+    def complete(self) -> bool:
+        return self.status == "complete"
+
+    def as_dict(self) -> Dict[str, Any]:
+        duration = None
+        if self.started_at is not None:
+            duration = round(((self.completed_at or time.monotonic()) - self.started_at) * 1000, 1)
+        return {"status": self.status, "duration_ms": duration, "steps": self.steps}
+
+
+warmup_state = WarmupState()
+
+
+def warm_language_detection() -> str:
+    """Load langdetect's language profiles (the first detect() call reads them from disk)"""
+    return detect("Esto es una frase para cargar los perfiles de idioma")
+
+
+def warm_db_pool(connections: int) -> int:
+    """Open and return pool connections so the first requests skip the connect handshake"""
+    opened = []
+    try:
+        for _ in range(connections):
+            conn = engine.connect()
+            conn.execute(text("SELECT 1"))
+            opened.append(conn)
+    finally:
+        for conn in opened:
+            conn.close()
+    return len(opened)
+
+
+def prime_product_cache(limit: int) -> List[int]:
+    """
+    Load the most-scanned products into the product cache
+    Falls back to the lowest product ids when no scan history has been saved yet
+    """
+    scan_counter.load()
+    product_ids = scan_counter.top(limit)
+
+    db = SessionLocal()
+    try:
+        if not product_ids:
+            product_ids = [row[0] for row in db.query(Product.id).order_by(Product.id).limit(limit)]
+        return [product_id for product_id in product_ids if get_product_entry(db, product_id)]
+    finally:
+        db.close()
+
+
+async def _step(name: str, coro) -> None:
+    started = time.perf_counter()
+    try:
+        result = await coro
+        warmup_state.steps[name] = {"ok": True, "result": result}
+    except Exception as e:
+        # A failed step is logged but does not block readiness; the first real
+        # request simply pays the cost instead
+        warmup_state.steps[name] = {"ok": False, "error": str(e)}
+        logger.warning("Warm-up step %s failed: %s", name, e)
+    warmup_state.steps[name]["duration_ms"] = round((time.perf_counter() - started) * 1000, 1)
+
+
+async def run_warmup(llm_service) -> None:
+    """
+    Preload langdetect profiles, DB pool connections, the LLM connection and the
+    product cache, then mark the worker ready
+    """
+    warmup_state.status = "running"
+    warmup_state.started_at = time.monotonic()
+
+    db_connections = int(os.getenv("WARMUP_DB_CONNECTIONS", "2"))
+    products = int(os.getenv("WARMUP_PRODUCTS", "50"))
+
+    # Blocking steps run in threads so /health keeps answering during warm-up
+    await asyncio.gather(
+        _step("language_detection", asyncio.to_thread(warm_language_detection)),
+        _step("db_pool", asyncio.to_thread(warm_db_pool, db_connections)),
+        _step("llm_connection", llm_service.warm_up()),
+    )
+    await _step("product_cache", asyncio.to_thread(lambda: len(prime_product_cache(products))))
+
+    warmup_state.completed_at = time.monotonic()
+    warmup_state.status = "complete"
+    logger.info("Warm-up complete", extra={"warmup": warmup_state.as_dict()})